@@ -7,7 +7,10 @@ from sqlalchemy.orm import Session
 
 from tc.core.security import AdminUser
 from tc.db.session import get_db
+from tc.domain.coordinator_cache import coordinator_cache_stats
+from tc.services.audit_service import audit_count_cache_stats
 from tc.services.deadline_service import check_deadlines
+from tc.services.health_service import recompute_stale_health
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -18,3 +21,18 @@ DB = Annotated[Session, Depends(get_db)]
 def run_check_deadlines(_user: AdminUser, db: DB):
     """Run the deadline checker on demand. Admin only."""
     return check_deadlines(db)
+
+
+@router.post("/recompute-health")
+def run_recompute_health(_user: AdminUser, db: DB):
+    """Run the health score recompute on demand. Admin only."""
+    return recompute_stale_health(db)
+
+
+@router.get("/cache-stats")
+def cache_stats(_user: AdminUser):
+    """Hit/miss counters for the in-process caches. Admin only."""
+    return {
+        "coordinators": coordinator_cache_stats(),
+        "audit_counts": audit_count_cache_stats(),
+    }
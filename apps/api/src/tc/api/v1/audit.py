@@ -6,10 +6,15 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from tc.core.pagination import InvalidCursorError
 from tc.core.security import AdminUser, require_role
 from tc.db.models.membership import Membership
 from tc.db.session import get_db
-from tc.services.audit_service import list_audit_events_for_org
+from tc.services.audit_service import (
+    count_audit_events_for_org,
+    list_audit_events_for_org,
+    list_audit_events_for_org_after,
+)
 
 router = APIRouter(
     prefix="/audit",
@@ -29,12 +34,21 @@ def list_org_audit(
     user: AdminUser,
     entity_type: str | None = None,
     action: str | None = None,
-    page: int = 1,
+    page: int | None = None,
     page_size: int = 20,
+    cursor: str | None = None,
+    include_total: bool = True,
 ):
-    """Org-wide audit feed — all events across all deals for the user's org."""
-    if page < 1:
+    """Org-wide audit feed — all events across all deals for the user's org.
+
+    Pages are keyset-based: follow ``next_cursor`` to fetch the next one. Passing
+    ``page`` selects legacy OFFSET paging instead. ``total`` is a cached count
+    (see ``AUDIT_COUNT_CACHE_TTL_SECONDS``); ``include_total=false`` skips it.
+    """
+    if page is not None and page < 1:
         raise HTTPException(status_code=400, detail=f"page must be >= 1, got {page}")
+    if page is not None and cursor is not None:
+        raise HTTPException(status_code=400, detail="Pass either page or cursor, not both")
     if page_size < 1 or page_size > MAX_PAGE_SIZE:
         raise HTTPException(
             status_code=400,
@@ -53,19 +67,40 @@ def list_org_audit(
     if membership is None:
         raise HTTPException(status_code=403, detail="Not an admin of this organisation")
 
-    events, total = list_audit_events_for_org(
-        db,
-        org_id=org_id,
-        entity_type=entity_type,
-        action=action,
-        page=page,
-        page_size=page_size,
-    )
+    next_cursor = None
+    if page is not None:
+        events = list_audit_events_for_org(
+            db,
+            org_id=org_id,
+            entity_type=entity_type,
+            action=action,
+            page=page,
+            page_size=page_size,
+        )
+    else:
+        try:
+            events, next_cursor = list_audit_events_for_org_after(
+                db,
+                org_id=org_id,
+                entity_type=entity_type,
+                action=action,
+                cursor=cursor,
+                limit=page_size,
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    total = None
+    if include_total:
+        total = count_audit_events_for_org(
+            db, org_id=org_id, entity_type=entity_type, action=action
+        )
 
     return {
         "page": page,
         "page_size": page_size,
         "total": total,
+        "next_cursor": next_cursor,
         "items": [
             {
                 "id": str(e.id),
@@ -146,18 +146,6 @@ def update_status(task_id: uuid.UUID, body: TaskStatusUpdate, user: CurrentUser,
 
     try:
         task = update_task_status(db, task_id=task_id, new_status=body.status)
-
-        # Recompute health score and save it to the transaction
-        from tc.services.health_service import compute_health_score
-
-        health = compute_health_score(db, task.transaction_id)
-
-        txn = get_transaction(db, task.transaction_id)
-        if txn:
-            txn.health_score = health["score"]
-            db.commit()
-            db.refresh(txn)
-
     except TaskNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found") from exc
     except TransactionNotFoundError as exc:
@@ -208,7 +196,7 @@ def assign(task_id: uuid.UUID, body: TaskAssign, user: CurrentUser, db: DB):
 @router.get("/transactions/{transaction_id}/health")
 def health(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
     """Return the health score (GREEN/YELLOW/RED) for a transaction."""
-    from tc.services.health_service import compute_health_score
+    from tc.services.health_service import get_health_score
 
     txn = get_transaction(db, transaction_id)
     if txn is None:
@@ -221,4 +209,4 @@ def health(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not a member of this organisation",
         )
-    return compute_health_score(db, transaction_id)
+    return get_health_score(db, transaction_id)
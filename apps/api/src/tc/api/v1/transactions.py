@@ -4,16 +4,19 @@ import uuid
 from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from tc.core.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
 from tc.core.security import CurrentUser
 from tc.db.session import get_db
 from tc.services.audit_service import list_audit_events_for_transaction
 from tc.services.transaction_service import (
     create_transaction,
-    get_transaction,
+    filter_accessible_transaction_ids,
+    get_transaction_for_user,
+    list_transaction_tasks,
     list_user_transactions,
     user_belongs_to_org,
 )
@@ -22,6 +25,13 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 
 DB = Annotated[Session, Depends(get_db)]
 
+MAX_HEALTH_BATCH = 1000
+MAX_TASK_PAGE_SIZE = 500
+MAX_TRANSACTION_PAGE_SIZE = 200
+MAX_AUDIT_PAGE_SIZE = 500
+
+TaskLimit = Annotated[int | None, Query(ge=1, le=MAX_TASK_PAGE_SIZE)]
+
 
 # -- Schemas ------------------------------------------------------------------
 
@@ -37,7 +47,40 @@ class TransactionCreate(BaseModel):
 # -- Helpers ------------------------------------------------------------------
 
 
-def _txn_to_dict(t, *, include_tasks: bool = False):
+def _get_accessible_transaction(db: Session, user, transaction_id: uuid.UUID):
+    """Load a transaction and check org membership in one query (404 / 403 otherwise)."""
+    txn, is_member = get_transaction_for_user(db, transaction_id, user.id)
+    if txn is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction not found",
+        )
+    if not is_member:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not a member of this organisation",
+        )
+    return txn
+
+
+def _list_tasks_page(
+    db: Session,
+    transaction_id: uuid.UUID,
+    response: Response,
+    *,
+    limit: int | None,
+    cursor: str | None,
+):
+    try:
+        tasks, next_cursor = list_transaction_tasks(db, transaction_id, limit=limit, cursor=cursor)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return tasks
+
+
+def _txn_to_dict(t, *, tasks=None):
     out = {
         "id": str(t.id),
         "org_id": str(t.org_id),
@@ -49,7 +92,7 @@ def _txn_to_dict(t, *, include_tasks: bool = False):
         "close_date": t.close_date.isoformat() if t.close_date else None,
         "created_at": t.created_at.isoformat() if t.created_at else None,
     }
-    if include_tasks:
+    if tasks is not None:
         out["tasks"] = [
             {
                 "id": str(task.id),
@@ -60,7 +103,7 @@ def _txn_to_dict(t, *, include_tasks: bool = False):
                 "status": task.status,
                 "due_at": task.due_at.isoformat() if task.due_at else None,
             }
-            for task in t.tasks
+            for task in tasks
         ]
     return out
 
@@ -92,36 +135,63 @@ def create(body: TransactionCreate, user: CurrentUser, db: DB):
     return _txn_to_dict(txn)
 
 
-@router.get("/{transaction_id}")
-def get_by_id(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
-    txn = get_transaction(db, transaction_id)
-    if txn is None:
+@router.get("/health")
+def batch_health(ids: str, user: CurrentUser, db: DB):
+    """Health scores for many transactions, keyed by id (comma-separated ``ids``).
+
+    Ids the user cannot access, or that do not exist, are left out of the result.
+    """
+    from tc.services.health_service import compute_health_scores
+
+    try:
+        requested = list(dict.fromkeys(uuid.UUID(v) for v in ids.split(",") if v.strip()))
+    except ValueError as exc:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
-        )
-    if not user_belongs_to_org(db, user.id, txn.org_id):
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be a comma-separated list of UUIDs",
+        ) from exc
+    if not requested or len(requested) > MAX_HEALTH_BATCH:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organisation",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"ids must contain between 1 and {MAX_HEALTH_BATCH} transaction ids",
         )
-    return _txn_to_dict(txn, include_tasks=True)
+
+    visible = filter_accessible_transaction_ids(db, user.id, requested)
+    scores = compute_health_scores(db, visible)
+    return {str(txn_id): score for txn_id, score in scores.items()}
+
+
+@router.get("/{transaction_id}")
+def get_by_id(
+    transaction_id: uuid.UUID,
+    user: CurrentUser,
+    db: DB,
+    response: Response,
+    task_limit: TaskLimit = None,
+    task_cursor: str | None = None,
+):
+    """A transaction with its tasks; pass ``task_limit`` to page through the tasks."""
+    txn = _get_accessible_transaction(db, user, transaction_id)
+    tasks = _list_tasks_page(db, transaction_id, response, limit=task_limit, cursor=task_cursor)
+    return _txn_to_dict(txn, tasks=tasks)
 
 
 @router.get("/{transaction_id}/tasks")
-def get_tasks(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
-    """List tasks belonging to a transaction."""
-    txn = get_transaction(db, transaction_id)
-    if txn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
-        )
-    if not user_belongs_to_org(db, user.id, txn.org_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organisation",
-        )
+def get_tasks(
+    transaction_id: uuid.UUID,
+    user: CurrentUser,
+    db: DB,
+    response: Response,
+    limit: TaskLimit = None,
+    cursor: str | None = None,
+):
+    """List tasks belonging to a transaction, ordered by due date.
+
+    With ``limit`` one keyset page is returned and the cursor for the next page
+    is sent in the ``X-Next-Cursor`` header.
+    """
+    _get_accessible_transaction(db, user, transaction_id)
+    tasks = _list_tasks_page(db, transaction_id, response, limit=limit, cursor=cursor)
     return [
         {
             "id": str(task.id),
@@ -132,31 +202,66 @@ def get_tasks(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
             "assignee_id": str(task.assignee_id) if task.assignee_id else None,
             "created_at": task.created_at.isoformat() if task.created_at else None,
         }
-        for task in txn.tasks
+        for task in tasks
     ]
 
 
 @router.get("")
-def list_all(user: CurrentUser, db: DB):
-    txns = list_user_transactions(db, user.id)
+def list_all(
+    user: CurrentUser,
+    db: DB,
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_TRANSACTION_PAGE_SIZE)] = 50,
+    cursor: str | None = None,
+    status_filter: Annotated[str | None, Query(alias="status")] = None,
+    health_score: str | None = None,
+    close_date_from: date | None = None,
+    close_date_to: date | None = None,
+):
+    """Transactions in the caller's orgs, newest first, one keyset page at a time.
+
+    The cursor for the next page is sent in the ``X-Next-Cursor`` header.
+    """
+    try:
+        txns, next_cursor = list_user_transactions(
+            db,
+            user.id,
+            limit=limit,
+            cursor=cursor,
+            status=status_filter,
+            health_score=health_score,
+            close_date_from=close_date_from,
+            close_date_to=close_date_to,
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [_txn_to_dict(t) for t in txns]
 
 
 @router.get("/{transaction_id}/audit")
-def get_audit(transaction_id: uuid.UUID, user: CurrentUser, db: DB):
-    """Audit trail for a transaction and its tasks."""
-    txn = get_transaction(db, transaction_id)
-    if txn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
-        )
-    if not user_belongs_to_org(db, user.id, txn.org_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organisation",
+def get_audit(
+    transaction_id: uuid.UUID,
+    user: CurrentUser,
+    db: DB,
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_AUDIT_PAGE_SIZE)] = 100,
+    cursor: str | None = None,
+):
+    """Audit trail for a transaction and its tasks, newest first.
+
+    The cursor for the next page is sent in the ``X-Next-Cursor`` header.
+    """
+    _get_accessible_transaction(db, user, transaction_id)
+    try:
+        events, next_cursor = list_audit_events_for_transaction(
+            db, transaction_id, cursor=cursor, limit=limit
         )
-    events = list_audit_events_for_transaction(db, transaction_id)
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [
         {
             "id": str(e.id),
@@ -176,27 +281,36 @@ def get_events(
     transaction_id: uuid.UUID,
     user: CurrentUser,
     db: DB,
+    response: Response,
     event_type: str | None = None,
-    page: int = 1,
+    page: int | None = None,
     page_size: int = 100,
+    cursor: str | None = None,
 ):
-    """Event logs for a transaction."""
-    from tc.services.event_log_service import list_event_logs_for_transaction
+    """Event logs for a transaction, newest first.
+
+    Pages are keyset-based: the cursor for the next page is sent in the
+    ``X-Next-Cursor`` header. Passing ``page`` selects legacy OFFSET paging.
+    """
+    from tc.services.event_log_service import (
+        list_event_logs_for_transaction,
+        list_event_logs_for_transaction_after,
+    )
 
-    txn = get_transaction(db, transaction_id)
-    if txn is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
+    _get_accessible_transaction(db, user, transaction_id)
+    if page is not None:
+        logs = list_event_logs_for_transaction(
+            db, transaction_id, event_type=event_type, page=page, page_size=page_size
         )
-    if not user_belongs_to_org(db, user.id, txn.org_id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not a member of this organisation",
-        )
-    logs = list_event_logs_for_transaction(
-        db, transaction_id, event_type=event_type, page=page, page_size=page_size
-    )
+    else:
+        try:
+            logs, next_cursor = list_event_logs_for_transaction_after(
+                db, transaction_id, event_type=event_type, cursor=cursor, limit=page_size
+            )
+        except InvalidCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        if next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return [
         {
             "id": str(log.id),
@@ -20,6 +20,26 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "http://localhost:3000"
 
     DEADLINE_CHECK_MINUTES: int = 15
+    DEADLINE_SWEEP_BATCH_SIZE: int = 500
+    DEADLINE_SWEEP_FANOUT: bool = False
+    DEADLINE_SWEEP_LEASE_SECONDS: int = 300
+
+    # Time-driven health score refresh (tasks crossing into due-soon / overdue).
+    HEALTH_RECOMPUTE_MINUTES: int = 15
+    HEALTH_RECOMPUTE_BATCH_SIZE: int = 500
+
+    # How long org audit feed totals are cached (0 counts on every request).
+    AUDIT_COUNT_CACHE_TTL_SECONDS: int = 30
+    AUDIT_COUNT_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Process-wide coordinator lookup tier for the rules engine (0 disables it).
+    COORDINATOR_CACHE_TTL_SECONDS: int = 60
+    COORDINATOR_CACHE_MAX_ENTRIES: int = 10_000
+
+    # Rule definitions file (defaults to core/rule_definitions.json) and how often
+    # workers re-check it for changes.
+    RULES_FILE: str = ""
+    RULES_RELOAD_SECONDS: int = 30
 
 
 settings = Settings()
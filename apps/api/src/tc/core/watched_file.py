@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+class WatchedFile:
+    """Re-reads a data file only when its content changes.
+
+    ``poll`` is cheap: it returns ``None`` without touching the disk within
+    ``min_interval`` seconds of the last check, then compares ``stat()``
+    (mtime, size) and only reads and hashes the file when that moved. The
+    content is returned when its SHA-256 differs from the last one seen.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        min_interval: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.path = path
+        self.min_interval = min_interval
+        self.checksum: str | None = None
+        self._clock = clock
+        self._last_check: float | None = None
+        self._signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def poll(self) -> bytes | None:
+        with self._lock:
+            now = self._clock()
+            if self._last_check is not None and now - self._last_check < self.min_interval:
+                return None
+            self._last_check = now
+
+            stat = self.path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._signature:
+                return None
+            self._signature = signature
+
+            content = self.path.read_bytes()
+            checksum = hashlib.sha256(content).hexdigest()
+            if checksum == self.checksum:
+                return None
+            self.checksum = checksum
+            return content
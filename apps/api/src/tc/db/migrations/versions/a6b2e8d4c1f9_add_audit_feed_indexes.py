@@ -0,0 +1,28 @@
+"""add org audit feed keyset indexes
+
+Revision ID: a6b2e8d4c1f9
+Revises: f1d7a4c2e9b5
+Create Date: 2026-10-17 14:26:33.270154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6b2e8d4c1f9'
+down_revision: Union[str, None] = 'f1d7a4c2e9b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_audit_events_org_id_created_at_id', 'audit_events', ['org_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_audit_events_org_id_action_created_at', 'audit_events', ['org_id', 'action', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_events_org_id_action_created_at', table_name='audit_events')
+    op.drop_index('ix_audit_events_org_id_created_at_id', table_name='audit_events')
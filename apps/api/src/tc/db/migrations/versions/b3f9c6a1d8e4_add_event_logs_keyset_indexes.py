@@ -0,0 +1,28 @@
+"""add event_logs keyset indexes
+
+Revision ID: b3f9c6a1d8e4
+Revises: a6b2e8d4c1f9
+Create Date: 2026-10-17 14:58:12.840551
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f9c6a1d8e4'
+down_revision: Union[str, None] = 'a6b2e8d4c1f9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_event_logs_transaction_id_created_at_id', 'event_logs', ['transaction_id', sa.literal_column('created_at DESC'), sa.literal_column('id DESC')], unique=False)
+    op.create_index('ix_event_logs_transaction_id_event_type_created_at', 'event_logs', ['transaction_id', 'event_type', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_event_logs_transaction_id_event_type_created_at', table_name='event_logs')
+    op.drop_index('ix_event_logs_transaction_id_created_at_id', table_name='event_logs')
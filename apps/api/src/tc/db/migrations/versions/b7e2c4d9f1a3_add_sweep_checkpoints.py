@@ -0,0 +1,42 @@
+"""add sweep_checkpoints table and tasks due_at keyset index
+
+Revision ID: b7e2c4d9f1a3
+Revises: a95f7a944cc1
+Create Date: 2026-10-17 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c4d9f1a3'
+down_revision: Union[str, None] = 'a95f7a944cc1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sweep_checkpoints',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('cursor_due_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('cursor_id', sa.Uuid(), nullable=True),
+    sa.Column('run_started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('overdue_marked', sa.Integer(), nullable=False),
+    sa.Column('due_soon_logged', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sweep_checkpoints_name'), 'sweep_checkpoints', ['name'], unique=True)
+    op.create_index('ix_tasks_due_at_id', 'tasks', ['due_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_due_at_id', table_name='tasks')
+    op.drop_index(op.f('ix_sweep_checkpoints_name'), table_name='sweep_checkpoints')
+    op.drop_table('sweep_checkpoints')
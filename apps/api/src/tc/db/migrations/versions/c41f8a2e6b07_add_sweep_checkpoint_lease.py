@@ -0,0 +1,28 @@
+"""add lease columns to sweep_checkpoints
+
+Revision ID: c41f8a2e6b07
+Revises: b7e2c4d9f1a3
+Create Date: 2026-10-17 10:03:11.542918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41f8a2e6b07'
+down_revision: Union[str, None] = 'b7e2c4d9f1a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sweep_checkpoints', sa.Column('locked_by', sa.String(length=100), nullable=True))
+    op.add_column('sweep_checkpoints', sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('sweep_checkpoints', 'locked_until')
+    op.drop_column('sweep_checkpoints', 'locked_by')
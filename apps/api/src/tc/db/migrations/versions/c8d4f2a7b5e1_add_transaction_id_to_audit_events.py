@@ -0,0 +1,48 @@
+"""add transaction_id to audit_events
+
+Revision ID: c8d4f2a7b5e1
+Revises: b3f9c6a1d8e4
+Create Date: 2026-10-17 15:31:40.377092
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d4f2a7b5e1'
+down_revision: Union[str, None] = 'b3f9c6a1d8e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('audit_events', sa.Column('transaction_id', sa.Uuid(), nullable=True))
+    op.create_foreign_key(op.f('fk_audit_events_transaction_id_transactions'), 'audit_events', 'transactions', ['transaction_id'], ['id'])
+
+    # Backfill: events on a transaction point at it directly, events on a task at its parent.
+    op.execute(
+        """
+        UPDATE audit_events SET transaction_id = entity_id
+        WHERE entity_type = 'transaction'
+          AND entity_id IN (SELECT id FROM transactions)
+        """
+    )
+    op.execute(
+        """
+        UPDATE audit_events SET transaction_id = (
+            SELECT tasks.transaction_id FROM tasks WHERE tasks.id = audit_events.entity_id
+        )
+        WHERE entity_type = 'task' AND transaction_id IS NULL
+        """
+    )
+
+    op.create_index('ix_audit_events_transaction_id_created_at_id', 'audit_events', ['transaction_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_events_transaction_id_created_at_id', table_name='audit_events')
+    op.drop_constraint(op.f('fk_audit_events_transaction_id_transactions'), 'audit_events', type_='foreignkey')
+    op.drop_column('audit_events', 'transaction_id')
@@ -0,0 +1,41 @@
+"""add transaction_health table
+
+Revision ID: d2a9e5b3c7f6
+Revises: c41f8a2e6b07
+Create Date: 2026-10-17 11:20:54.307611
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9e5b3c7f6'
+down_revision: Union[str, None] = 'c41f8a2e6b07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('transaction_health',
+    sa.Column('transaction_id', sa.Uuid(), nullable=False),
+    sa.Column('overdue_count', sa.Integer(), nullable=False),
+    sa.Column('due_soon_count', sa.Integer(), nullable=False),
+    sa.Column('overdue_weighted', sa.Float(), nullable=False),
+    sa.Column('due_soon_weighted', sa.Float(), nullable=False),
+    sa.Column('has_critical_overdue', sa.Boolean(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['transaction_id'], ['transactions.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_transaction_health_transaction_id'), 'transaction_health', ['transaction_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_transaction_health_transaction_id'), table_name='transaction_health')
+    op.drop_table('transaction_health')
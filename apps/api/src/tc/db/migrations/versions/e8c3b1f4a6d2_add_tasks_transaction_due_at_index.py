@@ -0,0 +1,26 @@
+"""add (transaction_id, due_at, id) index on tasks
+
+Revision ID: e8c3b1f4a6d2
+Revises: d2a9e5b3c7f6
+Create Date: 2026-10-17 13:20:47.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3b1f4a6d2'
+down_revision: Union[str, None] = 'd2a9e5b3c7f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_transaction_id_due_at_id', 'tasks', ['transaction_id', 'due_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_transaction_id_due_at_id', table_name='tasks')
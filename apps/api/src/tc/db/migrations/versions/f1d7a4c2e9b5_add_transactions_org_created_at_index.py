@@ -0,0 +1,26 @@
+"""add (org_id, created_at, id) index on transactions
+
+Revision ID: f1d7a4c2e9b5
+Revises: e8c3b1f4a6d2
+Create Date: 2026-10-17 13:52:09.604417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1d7a4c2e9b5'
+down_revision: Union[str, None] = 'e8c3b1f4a6d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_transactions_org_id_created_at_id', 'transactions', ['org_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transactions_org_id_created_at_id', table_name='transactions')
@@ -2,9 +2,11 @@ from tc.db.models.audit import AuditEvent
 from tc.db.models.event_log import EventLog
 from tc.db.models.membership import Membership
 from tc.db.models.org import Org
+from tc.db.models.sweep_checkpoint import SweepCheckpoint
 from tc.db.models.task import Task
 from tc.db.models.timeline import TimelineItem
 from tc.db.models.transaction import Transaction
+from tc.db.models.transaction_health import TransactionHealth
 from tc.db.models.user import User
 
 __all__ = [
@@ -12,8 +14,10 @@ __all__ = [
     "EventLog",
     "Membership",
     "Org",
+    "SweepCheckpoint",
     "Task",
     "TimelineItem",
     "Transaction",
+    "TransactionHealth",
     "User",
 ]
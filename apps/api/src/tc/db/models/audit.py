@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from tc.db.base import Base
@@ -10,6 +10,13 @@ from tc.db.base import Base
 
 class AuditEvent(Base):
     __tablename__ = "audit_events"
+    __table_args__ = (
+        # Keyset order of the org audit feed, unfiltered and filtered by action.
+        Index("ix_audit_events_org_id_created_at_id", "org_id", "created_at", "id"),
+        Index("ix_audit_events_org_id_action_created_at", "org_id", "action", "created_at"),
+        # Keyset order of a transaction's audit trail.
+        Index("ix_audit_events_transaction_id_created_at_id", "transaction_id", "created_at", "id"),
+    )
 
     org_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("orgs.id"), index=True)
     actor_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -18,4 +25,8 @@ class AuditEvent(Base):
     action: Mapped[str] = mapped_column(String(100), index=True)
     entity_type: Mapped[str] = mapped_column(String(50))
     entity_id: Mapped[uuid.UUID | None] = mapped_column(default=None)
+    # Transaction the entity belongs to (the transaction itself, or a task's parent).
+    transaction_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey("transactions.id"), default=None
+    )
     detail: Mapped[str | None] = mapped_column(Text, default=None)
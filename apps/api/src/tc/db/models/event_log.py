@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from tc.db.base import Base
@@ -10,9 +10,26 @@ from tc.db.base import Base
 
 class EventLog(Base):
     __tablename__ = "event_logs"
+    __table_args__ = (
+        Index(
+            "ix_event_logs_transaction_id_event_type_created_at",
+            "transaction_id",
+            "event_type",
+            "created_at",
+        ),
+    )
 
     transaction_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("transactions.id"), index=True)
     event_type: Mapped[str] = mapped_column(String(100), index=True)
     entity_type: Mapped[str] = mapped_column(String(50))
     entity_id: Mapped[uuid.UUID | None] = mapped_column(default=None)
     detail: Mapped[str | None] = mapped_column(Text, default=None)
+
+
+# Keyset order of a transaction's event feed (newest first).
+Index(
+    "ix_event_logs_transaction_id_created_at_id",
+    EventLog.transaction_id,
+    EventLog.created_at.desc(),
+    EventLog.id.desc(),
+)
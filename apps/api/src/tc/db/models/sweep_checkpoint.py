@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from tc.db.base import Base
+
+
+class SweepCheckpoint(Base):
+    """Keyset position of a batched background sweep, so a retried run resumes mid-way.
+
+    ``locked_by``/``locked_until`` form a lease so two workers never run the
+    same sweep (e.g. the same org shard) at once.
+    """
+
+    __tablename__ = "sweep_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    cursor_due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    cursor_id: Mapped[uuid.UUID | None] = mapped_column(default=None)
+    run_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
+    overdue_marked: Mapped[int] = mapped_column(Integer, default=0)
+    due_soon_logged: Mapped[int] = mapped_column(Integer, default=0)
+    locked_by: Mapped[str | None] = mapped_column(String(100), default=None)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=None)
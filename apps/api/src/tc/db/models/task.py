@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from tc.db.base import Base
@@ -16,6 +16,12 @@ if TYPE_CHECKING:
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Keyset order of the batched deadline sweep.
+        Index("ix_tasks_due_at_id", "due_at", "id"),
+        # Keyset order of a transaction's task list.
+        Index("ix_tasks_transaction_id_due_at_id", "transaction_id", "due_at", "id"),
+    )
 
     transaction_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("transactions.id"), index=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -5,7 +5,7 @@ from datetime import date
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, ForeignKey, String, Text
+from sqlalchemy import Date, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from tc.db.base import Base
@@ -24,6 +24,8 @@ class TransactionStatus(StrEnum):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    # Keyset order of an org's transaction listing.
+    __table_args__ = (Index("ix_transactions_org_id_created_at_id", "org_id", "created_at", "id"),)
 
     org_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("orgs.id"), index=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from tc.db.base import Base
+
+
+class TransactionHealth(Base):
+    """Persisted health aggregate of a transaction's tasks, so health reads are O(1)."""
+
+    __tablename__ = "transaction_health"
+
+    transaction_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("transactions.id"), unique=True, index=True
+    )
+    overdue_count: Mapped[int] = mapped_column(Integer, default=0)
+    due_soon_count: Mapped[int] = mapped_column(Integer, default=0)
+    overdue_weighted: Mapped[float] = mapped_column(Float, default=0.0)
+    due_soon_weighted: Mapped[float] = mapped_column(Float, default=0.0)
+    has_critical_overdue: Mapped[bool] = mapped_column(default=False)
+    computed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
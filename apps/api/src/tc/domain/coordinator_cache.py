@@ -0,0 +1,143 @@
+"""
+Coordinator lookup cache for the rules engine.
+
+Escalation rules assign follow-up tasks to the org's coordinator (its lowest
+admin user_id). Lookups are memoised per session — i.e. per request or per
+deadline sweep — and optionally in a TTL-bounded process-wide tier
+(``COORDINATOR_CACHE_TTL_SECONDS``; 0 disables it). Flushing a Membership
+change invalidates the affected org in both tiers; other processes rely on
+the TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from tc.core.cache import MISSING, TTLCache
+from tc.core.config import settings
+
+_SESSION_KEY = "coordinator_cache"
+
+_shared = TTLCache(
+    ttl=settings.COORDINATOR_CACHE_TTL_SECONDS,
+    maxsize=settings.COORDINATOR_CACHE_MAX_ENTRIES,
+)
+
+_totals_lock = threading.Lock()
+_totals = {"hits": 0, "misses": 0}
+
+
+def _load_coordinators(
+    db: Session, org_ids: Sequence[uuid.UUID]
+) -> dict[uuid.UUID, uuid.UUID | None]:
+    """Coordinator for each org, in a single query."""
+    from tc.db.models.membership import Membership
+
+    coordinators: dict[uuid.UUID, uuid.UUID | None] = dict.fromkeys(org_ids)
+    rows = db.execute(
+        select(Membership.org_id, Membership.user_id)
+        .where(Membership.org_id.in_(org_ids), Membership.role == "admin")
+        .order_by(Membership.org_id, Membership.user_id.asc())
+    )
+    for org_id, user_id in rows:
+        if coordinators[org_id] is None:
+            coordinators[org_id] = user_id
+    return coordinators
+
+
+class CoordinatorCache:
+    """Session-scoped org -> coordinator memo in front of the shared TTL tier."""
+
+    def __init__(self, shared: TTLCache | None = None) -> None:
+        self._local: dict[uuid.UUID, uuid.UUID | None] = {}
+        self._shared = shared if shared is not None else _shared
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(
+        self, db: Session, org_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, uuid.UUID | None]:
+        result: dict[uuid.UUID, uuid.UUID | None] = {}
+        missing: list[uuid.UUID] = []
+        for org_id in dict.fromkeys(org_ids):
+            if org_id in self._local:
+                result[org_id] = self._local[org_id]
+                continue
+            value = self._shared.get(org_id, MISSING) if self._shared.enabled else MISSING
+            if value is MISSING:
+                missing.append(org_id)
+            else:
+                self._local[org_id] = result[org_id] = value
+
+        hits = len(result)
+        if missing:
+            for org_id, coordinator in _load_coordinators(db, missing).items():
+                self._local[org_id] = result[org_id] = coordinator
+                self._shared.set(org_id, coordinator)
+
+        self.hits += hits
+        self.misses += len(missing)
+        with _totals_lock:
+            _totals["hits"] += hits
+            _totals["misses"] += len(missing)
+        return result
+
+    def invalidate(self, org_id: uuid.UUID) -> None:
+        self._local.pop(org_id, None)
+        self._shared.discard(org_id)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._local)}
+
+
+def coordinator_cache_for(db: Session) -> CoordinatorCache:
+    """The coordinator cache scoped to *db*'s lifetime (one request or sweep)."""
+    cache = db.info.get(_SESSION_KEY)
+    if cache is None:
+        cache = db.info[_SESSION_KEY] = CoordinatorCache()
+    return cache
+
+
+def invalidate_coordinator(org_id: uuid.UUID) -> None:
+    """Drop *org_id* from the process-wide tier (session tiers are invalidated on flush)."""
+    _shared.discard(org_id)
+
+
+def coordinator_cache_stats() -> dict:
+    """Process-wide hit/miss counters across all sessions, plus the shared tier's stats."""
+    with _totals_lock:
+        lookups = _totals["hits"] + _totals["misses"]
+        totals = {
+            "hits": _totals["hits"],
+            "misses": _totals["misses"],
+            "hit_rate": round(_totals["hits"] / lookups, 4) if lookups else 0.0,
+        }
+    return {**totals, "shared": _shared.stats()}
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_membership_change(session: Session, _flush_context) -> None:
+    from tc.db.models.membership import Membership
+
+    changed = [
+        obj
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Membership)
+    ]
+    if not changed:
+        return
+
+    cache = session.info.get(_SESSION_KEY)
+    for membership in changed:
+        org_ids = {membership.org_id, *inspect(membership).attrs.org_id.history.deleted}
+        for org_id in org_ids:
+            if org_id is None:
+                continue
+            invalidate_coordinator(org_id)
+            if cache is not None:
+                cache.invalidate(org_id)
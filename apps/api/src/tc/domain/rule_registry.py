@@ -0,0 +1,157 @@
+"""
+Compiled rule registry for the rules engine.
+
+Rule definitions live in a JSON data file (``core/rule_definitions.json`` by
+default, overridable with ``RULES_FILE``). They are validated and compiled
+once — title templates pre-parsed, rules indexed by trigger — so a lookup is
+a single dict access however many rules exist. The file is re-checked at most
+every ``RULES_RELOAD_SECONDS`` and recompiled only when its checksum changes,
+which hot-reloads rules in both the API and Celery workers without a
+redeploy. A definition file that fails validation is logged and ignored; the
+previously compiled registry stays live.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import string
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+
+from tc.core.config import settings
+from tc.core.watched_file import WatchedFile
+from tc.domain.enums import TaskSeverity
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_FILE = Path(__file__).parent.parent / "core" / "rule_definitions.json"
+
+# Placeholders a title template may reference.
+TEMPLATE_FIELDS = frozenset({"task_title"})
+
+
+@dataclass(frozen=True)
+class RuleDef:
+    """A single declarative rule: 'if *trigger* fires, create a task'."""
+
+    name: str
+    trigger: str
+    task_title_template: str
+    task_category: str
+    task_severity: str
+    assign_to_coordinator: bool = False
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A RuleDef with its title template parsed once into literal/field segments."""
+
+    rule: RuleDef
+    title_parts: tuple[tuple[str, str | None, str], ...]
+
+    @classmethod
+    def compile(cls, rule: RuleDef) -> CompiledRule:
+        parts: list[tuple[str, str | None, str]] = []
+        for literal, field, spec, conversion in string.Formatter().parse(rule.task_title_template):
+            if field is not None and field not in TEMPLATE_FIELDS:
+                raise ValueError(f"Rule '{rule.name}': unknown template field '{{{field}}}'")
+            if conversion:
+                raise ValueError(f"Rule '{rule.name}': template conversions are not supported")
+            parts.append((literal, field, spec or ""))
+        return cls(rule=rule, title_parts=tuple(parts))
+
+    def render_title(self, **fields: str) -> str:
+        out: list[str] = []
+        for literal, field, spec in self.title_parts:
+            out.append(literal)
+            if field is not None:
+                out.append(format(fields[field], spec))
+        return "".join(out)
+
+
+@dataclass(frozen=True)
+class RuleRegistry:
+    """Immutable, trigger-indexed set of compiled rules."""
+
+    by_trigger: MappingProxyType[str, tuple[CompiledRule, ...]]
+    checksum: str | None = None
+
+    def rules_for(self, trigger: str) -> tuple[CompiledRule, ...]:
+        return self.by_trigger.get(trigger, ())
+
+    def __len__(self) -> int:
+        return sum(len(rules) for rules in self.by_trigger.values())
+
+
+def compile_rules(rules: list[RuleDef], checksum: str | None = None) -> RuleRegistry:
+    """Validate *rules* and build the trigger index."""
+    seen: set[str] = set()
+    by_trigger: dict[str, list[CompiledRule]] = {}
+    for rule in rules:
+        if rule.name in seen:
+            raise ValueError(f"Duplicate rule name '{rule.name}'")
+        seen.add(rule.name)
+        try:
+            TaskSeverity(rule.task_severity)
+        except ValueError as exc:
+            raise ValueError(
+                f"Rule '{rule.name}': invalid severity '{rule.task_severity}'"
+            ) from exc
+        by_trigger.setdefault(rule.trigger, []).append(CompiledRule.compile(rule))
+    return RuleRegistry(
+        by_trigger=MappingProxyType({k: tuple(v) for k, v in by_trigger.items()}),
+        checksum=checksum,
+    )
+
+
+def parse_rule_definitions(content: bytes, checksum: str | None = None) -> RuleRegistry:
+    """Parse the JSON rule definition file into a compiled registry."""
+    data = json.loads(content)
+    try:
+        rules = [RuleDef(**entry) for entry in data["rules"]]
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Malformed rule definitions: {exc}") from exc
+    return compile_rules(rules, checksum=checksum)
+
+
+class RuleRegistryLoader:
+    """Holds the live registry and swaps it when the definition file changes."""
+
+    def __init__(self, path: Path, *, min_interval: float = 0.0) -> None:
+        self._file = WatchedFile(path, min_interval=min_interval)
+        self._registry: RuleRegistry | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> RuleRegistry:
+        with self._lock:
+            try:
+                content = self._file.poll()
+                if content is not None:
+                    self._registry = parse_rule_definitions(content, checksum=self._file.checksum)
+                    logger.info(
+                        "Loaded %d rule(s) from %s (sha256=%s)",
+                        len(self._registry),
+                        self._file.path,
+                        self._file.checksum,
+                    )
+            except (OSError, ValueError):
+                if self._registry is None:
+                    raise
+                logger.exception(
+                    "Rule reload from %s failed; keeping previous rules", self._file.path
+                )
+            return self._registry
+
+
+_loader = RuleRegistryLoader(
+    Path(settings.RULES_FILE) if settings.RULES_FILE else DEFAULT_RULES_FILE,
+    min_interval=settings.RULES_RELOAD_SECONDS,
+)
+
+
+def get_rule_registry() -> RuleRegistry:
+    """The current compiled rule registry, hot-reloaded when the definition file changes."""
+    return _loader.get()
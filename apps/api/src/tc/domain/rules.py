@@ -1,7 +1,8 @@
 """
 Deterministic rules engine for Transaction Control.
 
-Rules are defined as data (dataclasses) in a registry list.
+Rules are defined as data in a JSON file and compiled into a
+trigger-indexed registry (see ``tc.domain.rule_registry``).
 The engine evaluates triggers and creates follow-up tasks
 with idempotent dedupe keys to prevent duplicates on re-runs.
 """
@@ -10,12 +11,17 @@ from __future__ import annotations
 
 import logging
 import uuid
-from dataclasses import dataclass
+from collections.abc import Sequence
 
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from tc.db.models.task import Task
+from tc.domain.coordinator_cache import coordinator_cache_for
+from tc.domain.enums import TaskStatus
+from tc.domain.rule_registry import get_rule_registry
 
 logger = logging.getLogger(__name__)
 
@@ -23,42 +29,11 @@ logger = logging.getLogger(__name__)
 TASK_TITLE_MAX_LEN = 255
 
 
-@dataclass(frozen=True)
-class RuleDef:
-    """A single declarative rule: 'if *trigger* fires, create a task'."""
-
-    name: str
-    trigger: str
-    task_title_template: str
-    task_category: str
-    task_severity: str
-    assign_to_coordinator: bool = False
-
-
-RULES: list[RuleDef] = [
-    RuleDef(
-        name="due_soon_reminder",
-        trigger="task.due_soon",
-        task_title_template="Reminder: Confirm '{task_title}' is scheduled",
-        task_category="reminder",
-        task_severity="medium",
-    ),
-    RuleDef(
-        name="overdue_escalation",
-        trigger="task.overdue",
-        task_title_template="ESCALATION: '{task_title}' is overdue",
-        task_category="escalation",
-        task_severity="critical",
-        assign_to_coordinator=True,
-    ),
-    RuleDef(
-        name="appraisal_low_negotiation",
-        trigger="appraisal.flagged_low",
-        task_title_template="Negotiate: appraisal flagged low for '{task_title}'",
-        task_category="negotiation",
-        task_severity="high",
-    ),
-]
+# Dialects whose INSERT supports ON CONFLICT DO NOTHING ... RETURNING.
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 
 def build_dedupe_key(rule_name: str, trigger: str, source_task_id: uuid.UUID) -> str:
@@ -93,81 +68,176 @@ def _is_dedupe_key_violation(exc: IntegrityError) -> bool:
 
 def _resolve_coordinator(db: Session, transaction_id: uuid.UUID) -> uuid.UUID | None:
     """Find the first admin member of the transaction's org to act as coordinator."""
-    from tc.db.models.membership import Membership
     from tc.db.models.transaction import Transaction
 
-    txn = db.query(Transaction).filter(Transaction.id == transaction_id).first()
-    if txn is None:
+    org_id = db.scalar(select(Transaction.org_id).where(Transaction.id == transaction_id))
+    if org_id is None:
         return None
-    membership = (
-        db.query(Membership)
-        .filter(Membership.org_id == txn.org_id, Membership.role == "admin")
-        .order_by(Membership.user_id.asc())
-        .first()
-    )
-    return membership.user_id if membership else None
+    return _resolve_coordinators(db, [org_id]).get(org_id)
 
 
-def evaluate_rules(
+def _resolve_coordinators(
+    db: Session, org_ids: Sequence[uuid.UUID]
+) -> dict[uuid.UUID, uuid.UUID | None]:
+    """Coordinator for each org, served from the session/process coordinator cache."""
+    if not org_ids:
+        return {}
+    return coordinator_cache_for(db).resolve(db, org_ids)
+
+
+def _insert_follow_up_tasks(db: Session, rows: list[dict]) -> list[Task]:
+    """Insert rule tasks, silently skipping any whose dedupe_key already exists.
+
+    Uses one ``INSERT ... ON CONFLICT (dedupe_key) DO NOTHING RETURNING`` where
+    the dialect supports it, and falls back to a SAVEPOINT per row otherwise.
+    """
+    dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+    if dialect_insert is not None:
+        stmt = (
+            dialect_insert(Task)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Task.dedupe_key])
+            .returning(Task)
+        )
+        return list(db.scalars(stmt))
+
+    created: list[Task] = []
+    for row in rows:
+        task = Task(**row)
+        try:
+            with db.begin_nested():
+                db.add(task)
+        except IntegrityError as e:
+            if _is_dedupe_key_violation(e):
+                continue
+            raise
+        created.append(task)
+    return created
+
+
+def evaluate_rules_batch(
     db: Session,
     *,
     trigger: str,
-    source_task: Task,
+    source_tasks: Sequence[Task],
 ) -> list[Task]:
     """
-    Run every rule whose trigger matches, creating follow-up tasks.
+    Run every rule matching *trigger* against many source tasks at once.
 
-    Returns the list of newly created tasks (empty if all deduplicated).
-    """
-    from tc.services.task_service import create_task
-
-    matching_rules = [r for r in RULES if r.trigger == trigger]
-    created: list[Task] = []
+    Existing dedupe keys are fetched with one ``IN`` query, coordinators are
+    resolved once per org, follow-up tasks are inserted in one statement and
+    their ``task.created`` audit events in one executemany. Source tasks only
+    need ``id``, ``title`` and ``transaction_id``, so rows selected by the
+    deadline sweep can be passed directly.
 
-    for rule in matching_rules:
-        dedupe_key = build_dedupe_key(rule.name, trigger, source_task.id)
-
-        exists = db.query(Task.id).filter(Task.dedupe_key == dedupe_key).first()
-        if exists:
-            logger.debug("Rule '%s' skipped — dedupe key '%s' exists", rule.name, dedupe_key)
+    Returns the newly created tasks (empty if all deduplicated).
+    """
+    from tc.db.models.transaction import Transaction
+    from tc.services.audit_service import create_audit_events
+
+    rules = get_rule_registry().rules_for(trigger)
+    if not rules or not source_tasks:
+        return []
+
+    candidates = [
+        (compiled, source, build_dedupe_key(compiled.rule.name, trigger, source.id))
+        for source in source_tasks
+        for compiled in rules
+    ]
+    existing = set(
+        db.scalars(
+            select(Task.dedupe_key).where(Task.dedupe_key.in_([key for _, _, key in candidates]))
+        )
+    )
+    for compiled, _, dedupe_key in candidates:
+        if dedupe_key in existing:
+            logger.debug(
+                "Rule '%s' skipped — dedupe key '%s' exists", compiled.rule.name, dedupe_key
+            )
+    candidates = [c for c in candidates if c[2] not in existing]
+    if not candidates:
+        return []
+
+    txn_ids = {source.transaction_id for _, source, _ in candidates}
+    org_by_txn = dict(
+        db.execute(
+            select(Transaction.id, Transaction.org_id).where(Transaction.id.in_(txn_ids))
+        ).all()
+    )
+    coordinators: dict[uuid.UUID, uuid.UUID | None] = {}
+    if any(compiled.rule.assign_to_coordinator for compiled, _, _ in candidates):
+        coordinators = _resolve_coordinators(db, list(set(org_by_txn.values())))
+
+    rows: list[dict] = []
+    for compiled, source, dedupe_key in candidates:
+        rule = compiled.rule
+        if source.transaction_id not in org_by_txn:
+            logger.warning(
+                "Rule '%s' skipped — transaction %s not found", rule.name, source.transaction_id
+            )
             continue
 
-        title = rule.task_title_template.format(task_title=source_task.title)
+        title = compiled.render_title(task_title=source.title)
         if len(title) > TASK_TITLE_MAX_LEN:
             title = title[:TASK_TITLE_MAX_LEN]
 
         assignee_id = None
         if rule.assign_to_coordinator:
-            assignee_id = _resolve_coordinator(db, source_task.transaction_id)
-
-        try:
-            with db.begin_nested():
-                new_task = create_task(
-                    db,
-                    transaction_id=source_task.transaction_id,
-                    title=title,
-                    assignee_id=assignee_id,
-                    dedupe_key=dedupe_key,
-                    category=rule.task_category,
-                    severity=rule.task_severity,
-                    commit=False,
-                )
-        except IntegrityError as e:
-            if _is_dedupe_key_violation(e):
-                logger.debug(
-                    "Rule '%s' skipped — dedupe key '%s' was inserted concurrently",
-                    rule.name,
-                    dedupe_key,
-                )
-                continue
-            raise
+            assignee_id = coordinators.get(org_by_txn[source.transaction_id])
+
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "transaction_id": source.transaction_id,
+                "title": title,
+                "assignee_id": assignee_id,
+                "status": TaskStatus.todo,
+                "dedupe_key": dedupe_key,
+                "category": rule.task_category,
+                "severity": rule.task_severity,
+            }
+        )
+    if not rows:
+        return []
 
-        logger.info(
-            "Rule '%s' created task %s (dedupe=%s)",
-            rule.name,
-            new_task.id,
-            dedupe_key,
+    created = _insert_follow_up_tasks(db, rows)
+    if len(created) < len(rows):
+        logger.debug(
+            "%d rule task(s) skipped — dedupe keys inserted concurrently", len(rows) - len(created)
         )
-        created.append(new_task)
 
+    create_audit_events(
+        db,
+        [
+            {
+                "org_id": org_by_txn[task.transaction_id],
+                "action": "task.created",
+                "entity_type": "task",
+                "entity_id": task.id,
+                "transaction_id": task.transaction_id,
+                "actor_id": None,
+                "detail": f"Task '{task.title}' created",
+            }
+            for task in created
+        ],
+    )
+
+    for task in created:
+        logger.info("Rule created task %s (dedupe=%s)", task.id, task.dedupe_key)
     return created
+
+
+def evaluate_rules(
+    db: Session,
+    *,
+    trigger: str,
+    source_task: Task,
+) -> list[Task]:
+    """
+    Run every rule whose trigger matches, creating follow-up tasks.
+
+    Single-task convenience wrapper around ``evaluate_rules_batch``.
+
+    Returns the list of newly created tasks (empty if all deduplicated).
+    """
+    return evaluate_rules_batch(db, trigger=trigger, source_tasks=[source_task])
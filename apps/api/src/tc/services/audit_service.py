@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
+from sqlalchemy import Select, func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
+from tc.core.cache import MISSING, TTLCache
+from tc.core.config import settings
+from tc.core.pagination import decode_cursor, encode_cursor
 from tc.db.models.audit import AuditEvent
 
+_count_cache = TTLCache(
+    ttl=settings.AUDIT_COUNT_CACHE_TTL_SECONDS,
+    maxsize=settings.AUDIT_COUNT_CACHE_MAX_ENTRIES,
+)
+
 
 def create_audit_event(
     db: Session,
@@ -14,6 +24,7 @@ def create_audit_event(
     action: str,
     entity_type: str,
     entity_id: uuid.UUID | None = None,
+    transaction_id: uuid.UUID | None = None,
     actor_id: uuid.UUID | None = None,
     detail: str | None = None,
 ) -> AuditEvent:
@@ -23,6 +34,7 @@ def create_audit_event(
         action=action,
         entity_type=entity_type,
         entity_id=entity_id,
+        transaction_id=transaction_id,
         detail=detail,
     )
     db.add(event)
@@ -30,50 +42,129 @@ def create_audit_event(
     return event
 
 
-def list_audit_events_for_transaction(db: Session, transaction_id: uuid.UUID) -> list[AuditEvent]:
-    """Return audit events whose entity is the transaction or any of its tasks."""
-    from tc.db.models.task import Task
+def create_audit_events(db: Session, rows: list[dict]) -> None:
+    """Bulk-insert audit events in one executemany.
+
+    Each row takes the same keys as ``create_audit_event``'s keyword arguments.
+    """
+    if not rows:
+        return
+    db.execute(insert(AuditEvent), rows)
 
-    task_ids = [
-        row[0] for row in db.query(Task.id).filter(Task.transaction_id == transaction_id).all()
-    ]
 
-    entity_ids = [transaction_id, *task_ids]
-    return (
-        db.query(AuditEvent)
-        .filter(AuditEvent.entity_id.in_(entity_ids))
-        .order_by(AuditEvent.created_at.desc())
-        .all()
+def list_audit_events_for_transaction(
+    db: Session,
+    transaction_id: uuid.UUID,
+    *,
+    cursor: str | None = None,
+    limit: int = 100,
+) -> tuple[list[AuditEvent], str | None]:
+    """
+    One keyset page of the audit events of a transaction and its tasks, newest first.
+
+    A single range scan on the (transaction_id, created_at, id) index. Returns
+    the events and the cursor for the next page (``None`` on the last one).
+    """
+    query = (
+        select(AuditEvent)
+        .where(AuditEvent.transaction_id == transaction_id)
+        .order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
     )
+    if cursor is not None:
+        before_created_at, before_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        query = query.where(
+            tuple_(AuditEvent.created_at, AuditEvent.id) < tuple_(before_created_at, before_id)
+        )
 
+    events = list(db.scalars(query.limit(limit + 1)))
+    if len(events) <= limit:
+        return events, None
+    events = events[:limit]
+    return events, encode_cursor([events[-1].created_at, events[-1].id])
 
-def list_audit_events_for_org(
+
+def _org_events_query(org_id: uuid.UUID, *, entity_type: str | None, action: str | None) -> Select:
+    query = select(AuditEvent).where(AuditEvent.org_id == org_id)
+    if entity_type:
+        query = query.where(AuditEvent.entity_type == entity_type)
+    if action:
+        query = query.where(AuditEvent.action == action)
+    return query
+
+
+def count_audit_events_for_org(
     db: Session,
     org_id: uuid.UUID,
     *,
     entity_type: str | None = None,
     action: str | None = None,
-    page: int = 1,
-    page_size: int = 20,
-) -> tuple[list[AuditEvent], int]:
-    """Return paginated audit events for an org with optional filters.
+) -> int:
+    """Number of matching audit events, cached for ``AUDIT_COUNT_CACHE_TTL_SECONDS``.
 
-    Returns (events, total_count).
+    The count may lag new events by up to the TTL; it is a display total, not
+    something pagination depends on.
     """
-    query = db.query(AuditEvent).filter(AuditEvent.org_id == org_id)
+    key = (org_id, entity_type, action)
+    total = _count_cache.get(key, MISSING)
+    if total is MISSING:
+        query = _org_events_query(org_id, entity_type=entity_type, action=action)
+        total = db.scalar(select(func.count()).select_from(query.subquery()))
+        _count_cache.set(key, total)
+    return total
 
-    if entity_type:
-        query = query.filter(AuditEvent.entity_type == entity_type)
-    if action:
-        query = query.filter(AuditEvent.action == action)
 
-    total = query.count()
+def audit_count_cache_stats() -> dict:
+    return _count_cache.stats()
+
 
-    events = (
-        query.order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+def list_audit_events_for_org(
+    db: Session,
+    org_id: uuid.UUID,
+    *,
+    entity_type: str | None = None,
+    action: str | None = None,
+    page: int = 1,
+    page_size: int = 20,
+) -> list[AuditEvent]:
+    """Return one OFFSET page of audit events for an org with optional filters."""
+    query = _org_events_query(org_id, entity_type=entity_type, action=action)
+    return list(
+        db.scalars(
+            query.order_by(AuditEvent.created_at.desc(), AuditEvent.id.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
     )
 
-    return events, total
+
+def list_audit_events_for_org_after(
+    db: Session,
+    org_id: uuid.UUID,
+    *,
+    entity_type: str | None = None,
+    action: str | None = None,
+    cursor: str | None = None,
+    limit: int = 20,
+) -> tuple[list[AuditEvent], str | None]:
+    """
+    One keyset page of an org's audit events, newest first.
+
+    Ordered by (created_at, id) descending, so every page is an index range
+    scan on (org_id, created_at, id) — or (org_id, action, created_at) when
+    filtering by action — however deep it is. Returns the events and the
+    cursor for the next page (``None`` on the last one).
+    """
+    query = _org_events_query(org_id, entity_type=entity_type, action=action).order_by(
+        AuditEvent.created_at.desc(), AuditEvent.id.desc()
+    )
+    if cursor is not None:
+        before_created_at, before_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        query = query.where(
+            tuple_(AuditEvent.created_at, AuditEvent.id) < tuple_(before_created_at, before_id)
+        )
+
+    events = list(db.scalars(query.limit(limit + 1)))
+    if len(events) <= limit:
+        return events, None
+    events = events[:limit]
+    return events, encode_cursor([events[-1].created_at, events[-1].id])
@@ -2,142 +2,359 @@ from __future__ import annotations
 
 import json
 import logging
+import uuid
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, exists, or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 
+from tc.core.config import settings
 from tc.db.models.event_log import EventLog
+from tc.db.models.sweep_checkpoint import SweepCheckpoint
 from tc.db.models.task import Task
+from tc.db.models.transaction import Transaction
+from tc.domain.coordinator_cache import coordinator_cache_for
 from tc.domain.enums import TaskStatus
-from tc.domain.rules import evaluate_rules
-from tc.services.audit_service import create_audit_event
+from tc.domain.rules import evaluate_rules_batch
+from tc.services.audit_service import create_audit_events
+from tc.services.event_log_service import create_event_logs
+from tc.services.health_service import refresh_transaction_health
 
 logger = logging.getLogger(__name__)
 
+DEADLINE_SWEEP_NAME = "deadlines"
 
-def check_deadlines(db: Session) -> dict:
-    """
-    1. Mark past-due tasks as overdue.
-    2. Detect tasks due within the next 48 hours (Due Soon).
-    3. Emit event_log + audit_events entries.
-    """
-    now = datetime.now(UTC)
-    due_soon_threshold = now + timedelta(hours=48)
+# Columns every sweep phase needs from a candidate task (plus the owning org for audit rows).
+_CANDIDATE_COLUMNS = (
+    Task.id,
+    Task.title,
+    Task.status,
+    Task.severity,
+    Task.due_at,
+    Task.transaction_id,
+    Transaction.org_id,
+)
 
-    overdue_tasks: list[Task] = (
-        db.query(Task)
-        .options(joinedload(Task.transaction))
-        .filter(
-            Task.due_at.isnot(None),
-            Task.due_at < now,
-            Task.status.notin_([TaskStatus.done, TaskStatus.overdue]),
+
+def _mark_overdue(db: Session, candidates: list, now: datetime) -> int:
+    """Flip a batch of past-due open tasks to overdue in one UPDATE and bulk-log the transitions."""
+    if not candidates:
+        return 0
+
+    # The candidate rows are locked, so their status is the true pre-update status.
+    # RETURNING tells us which rows actually transitioned.
+    marked_ids = set(
+        db.scalars(
+            update(Task)
+            .where(
+                Task.id.in_([row.id for row in candidates]),
+                Task.status.notin_([TaskStatus.done, TaskStatus.overdue]),
+            )
+            .values(status=TaskStatus.overdue)
+            .returning(Task.id)
         )
-        .all()
     )
+    marked = [row for row in candidates if row.id in marked_ids]
 
-    for task in overdue_tasks:
-        old_status = task.status
-        task.status = TaskStatus.overdue
-
-        payload = {
-            "task_id": str(task.id),
-            "task_title": task.title,
-            "transaction_id": str(task.transaction_id),
-            "old_status": old_status,
-            "new_status": TaskStatus.overdue,
-            "severity": task.severity or "medium",
-            "due_at": task.due_at.isoformat() if task.due_at else None,
-            "marked_overdue_at": now.isoformat(),
-        }
-        detail = json.dumps(payload)
-
-        db.add(
-            EventLog(
-                transaction_id=task.transaction_id,
-                event_type="task.overdue",
-                entity_type="task",
-                entity_id=task.id,
-                detail=detail,
-            )
+    event_rows: list[dict] = []
+    audit_rows: list[dict] = []
+    for row in marked:
+        detail = json.dumps(
+            {
+                "task_id": str(row.id),
+                "task_title": row.title,
+                "transaction_id": str(row.transaction_id),
+                "old_status": row.status,
+                "new_status": TaskStatus.overdue,
+                "severity": row.severity or "medium",
+                "due_at": row.due_at.isoformat() if row.due_at else None,
+                "marked_overdue_at": now.isoformat(),
+            }
+        )
+        event_rows.append(
+            {
+                "transaction_id": row.transaction_id,
+                "event_type": "task.overdue",
+                "entity_type": "task",
+                "entity_id": row.id,
+                "detail": detail,
+            }
+        )
+        audit_rows.append(
+            {
+                "org_id": row.org_id,
+                "action": "task.marked_overdue",
+                "entity_type": "task",
+                "entity_id": row.id,
+                "transaction_id": row.transaction_id,
+                "actor_id": None,
+                "detail": detail,
+            }
         )
 
-        create_audit_event(
-            db,
-            org_id=task.transaction.org_id,
-            action="task.marked_overdue",
-            entity_type="task",
-            entity_id=task.id,
-            actor_id=None,
-            detail=detail,
+    create_event_logs(db, event_rows)
+    create_audit_events(db, audit_rows)
+
+    evaluate_rules_batch(db, trigger="task.overdue", source_tasks=marked)
+
+    return len(marked)
+
+
+def _log_due_soon(db: Session, rows: list, now: datetime) -> int:
+    """Log a batch of open tasks entering the 48h window that have no due-soon event yet."""
+    if not rows:
+        return 0
+
+    event_rows: list[dict] = []
+    audit_rows: list[dict] = []
+    for row in rows:
+        detail = json.dumps(
+            {
+                "task_id": str(row.id),
+                "task_title": row.title,
+                "severity": row.severity or "medium",
+                "due_at": row.due_at.isoformat(),
+                "hours_remaining": round(
+                    (row.due_at.astimezone(UTC) - now).total_seconds() / 3600, 1
+                ),
+            }
+        )
+        event_rows.append(
+            {
+                "transaction_id": row.transaction_id,
+                "event_type": "task.due_soon",
+                "entity_type": "task",
+                "entity_id": row.id,
+                "detail": detail,
+            }
         )
+        audit_rows.append(
+            {
+                "org_id": row.org_id,
+                "action": "task.due_soon",
+                "entity_type": "task",
+                "entity_id": row.id,
+                "transaction_id": row.transaction_id,
+                "actor_id": None,
+                "detail": detail,
+            }
+        )
+
+    create_event_logs(db, event_rows)
+    create_audit_events(db, audit_rows)
+
+    evaluate_rules_batch(db, trigger="task.due_soon", source_tasks=rows)
+
+    return len(rows)
+
+
+def _checkpoint_name(org_id: uuid.UUID | None) -> str:
+    if org_id is None:
+        return DEADLINE_SWEEP_NAME
+    return f"{DEADLINE_SWEEP_NAME}:org:{org_id}"
+
+
+def _acquire_lease(db: Session, name: str, owner: str, now: datetime) -> bool:
+    """Take the sweep lease unless another owner holds an unexpired one."""
+    if db.query(SweepCheckpoint.id).filter(SweepCheckpoint.name == name).first() is None:
+        try:
+            with db.begin_nested():
+                db.add(SweepCheckpoint(name=name))
+        except IntegrityError:
+            logger.debug("check_deadlines: checkpoint '%s' created concurrently", name)
+
+    result = db.execute(
+        update(SweepCheckpoint)
+        .where(
+            SweepCheckpoint.name == name,
+            or_(SweepCheckpoint.locked_until.is_(None), SweepCheckpoint.locked_until < now),
+        )
+        .values(
+            locked_by=owner,
+            locked_until=now + timedelta(seconds=settings.DEADLINE_SWEEP_LEASE_SECONDS),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
 
-        evaluate_rules(db, trigger="task.overdue", source_task=task)
 
-    due_soon_tasks: list[Task] = (
-        db.query(Task)
-        .options(joinedload(Task.transaction))
-        .filter(
+def _release_lease(db: Session, name: str, owner: str) -> None:
+    db.execute(
+        update(SweepCheckpoint)
+        .where(SweepCheckpoint.name == name, SweepCheckpoint.locked_by == owner)
+        .values(locked_by=None, locked_until=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def _load_checkpoint(db: Session, name: str, now: datetime) -> SweepCheckpoint:
+    """Return the sweep checkpoint, resetting it unless the previous run stopped mid-way."""
+    checkpoint = db.query(SweepCheckpoint).filter(SweepCheckpoint.name == name).one()
+    if checkpoint.completed_at is None and checkpoint.run_started_at is not None:
+        logger.info(
+            "check_deadlines: resuming '%s' after (%s, %s)",
+            name,
+            checkpoint.cursor_due_at,
+            checkpoint.cursor_id,
+        )
+        return checkpoint
+
+    checkpoint.cursor_due_at = None
+    checkpoint.cursor_id = None
+    checkpoint.run_started_at = now
+    checkpoint.completed_at = None
+    checkpoint.overdue_marked = 0
+    checkpoint.due_soon_logged = 0
+    return checkpoint
+
+
+def _next_batch(
+    db: Session,
+    checkpoint: SweepCheckpoint,
+    now: datetime,
+    batch_size: int,
+    org_id: uuid.UUID | None,
+) -> list:
+    """Next open tasks due before the due-soon horizon, in (due_at, id) keyset order."""
+    due_soon_threshold = now + timedelta(hours=48)
+    already_logged = exists().where(
+        EventLog.entity_id == Task.id,
+        EventLog.event_type == "task.due_soon",
+    )
+
+    query = (
+        select(
+            *_CANDIDATE_COLUMNS,
+            case((Task.due_at < now, True), else_=False).label("is_overdue"),
+            case((Task.due_at > now, True), else_=False).label("is_upcoming"),
+            already_logged.label("due_soon_logged"),
+        )
+        .join(Transaction, Task.transaction_id == Transaction.id)
+        .where(
             Task.due_at.isnot(None),
-            Task.due_at > now,
             Task.due_at <= due_soon_threshold,
-            Task.status.in_([TaskStatus.todo, TaskStatus.in_progress]),
+            Task.status.notin_([TaskStatus.done, TaskStatus.overdue]),
         )
-        .all()
+        .order_by(Task.due_at, Task.id)
+        .limit(batch_size)
+        .with_for_update(of=Task, skip_locked=True)
     )
-
-    due_soon_count = 0
-    for task in due_soon_tasks:
-        already_logged = (
-            db.query(EventLog)
-            .filter(EventLog.entity_id == task.id, EventLog.event_type == "task.due_soon")
-            .first()
+    if org_id is not None:
+        query = query.where(Transaction.org_id == org_id)
+    if checkpoint.cursor_id is not None:
+        query = query.where(
+            tuple_(Task.due_at, Task.id) > tuple_(checkpoint.cursor_due_at, checkpoint.cursor_id)
         )
+    return db.execute(query).all()
 
-        if not already_logged:
-            payload = {
-                "task_id": str(task.id),
-                "task_title": task.title,
-                "severity": task.severity or "medium",
-                "due_at": task.due_at.isoformat(),
-                "hours_remaining": round(
-                    (task.due_at.astimezone(UTC) - now).total_seconds() / 3600, 1
-                ),
-            }
-            detail = json.dumps(payload)
-            db.add(
-                EventLog(
-                    transaction_id=task.transaction_id,
-                    event_type="task.due_soon",
-                    entity_type="task",
-                    entity_id=task.id,
-                    detail=detail,
-                )
-            )
 
-            create_audit_event(
-                db,
-                org_id=task.transaction.org_id,
-                action="task.due_soon",
-                entity_type="task",
-                entity_id=task.id,
-                actor_id=None,
-                detail=detail,
-            )
+def check_deadlines(
+    db: Session,
+    *,
+    org_id: uuid.UUID | None = None,
+    batch_size: int | None = None,
+) -> dict:
+    """
+    1. Mark past-due tasks as overdue (one set-based UPDATE ... RETURNING per batch).
+    2. Detect tasks due within the next 48 hours (Due Soon) via an anti-join on event_logs.
+    3. Bulk-insert event_log + audit_events entries.
 
-            evaluate_rules(db, trigger="task.due_soon", source_task=task)
+    Tasks are walked in (due_at, id) keyset order in batches of
+    ``DEADLINE_SWEEP_BATCH_SIZE``; each batch is committed together with the
+    sweep checkpoint, so a retried run resumes after the last committed batch.
+    Counts in the summary cover the whole run, including resumed batches.
 
-            due_soon_count += 1
+    With ``org_id`` only that org's tasks are swept, under their own checkpoint.
+    Every sweep holds a lease on its checkpoint; if another worker already holds
+    it the call returns zero counts without touching any task.
+    """
+    batch_size = batch_size or settings.DEADLINE_SWEEP_BATCH_SIZE
+    now = datetime.now(UTC)
+    name = _checkpoint_name(org_id)
+    owner = uuid.uuid4().hex
 
-    db.commit()
+    if not _acquire_lease(db, name, owner, now):
+        logger.info("check_deadlines: '%s' is locked by another worker, skipping", name)
+        return {"checked_at": now.isoformat(), "overdue_marked": 0, "due_soon_logged": 0}
+
+    try:
+        checkpoint = _load_checkpoint(db, name, now)
+
+        while True:
+            batch = _next_batch(db, checkpoint, now, batch_size, org_id)
+            if not batch:
+                break
+
+            overdue = [row for row in batch if row.is_overdue]
+            due_soon = [
+                row
+                for row in batch
+                if row.is_upcoming
+                and not row.due_soon_logged
+                and row.status in (TaskStatus.todo, TaskStatus.in_progress)
+            ]
+            checkpoint.overdue_marked += _mark_overdue(db, overdue, now)
+            checkpoint.due_soon_logged += _log_due_soon(db, due_soon, now)
+            refresh_transaction_health(db, [row.transaction_id for row in overdue + due_soon])
+            checkpoint.cursor_due_at = batch[-1].due_at
+            checkpoint.cursor_id = batch[-1].id
+            checkpoint.locked_until = datetime.now(UTC) + timedelta(
+                seconds=settings.DEADLINE_SWEEP_LEASE_SECONDS
+            )
+            db.commit()
+
+            if len(batch) < batch_size:
+                break
+
+        checkpoint.completed_at = datetime.now(UTC)
+        checkpoint.locked_by = None
+        checkpoint.locked_until = None
+        db.commit()
+    except Exception:
+        db.rollback()
+        _release_lease(db, name, owner)
+        raise
 
     logger.info(
-        "check_deadlines: marked %d overdue, detected %d new due-soon",
-        len(overdue_tasks),
-        due_soon_count,
+        "check_deadlines: '%s' marked %d overdue, detected %d new due-soon (coordinators %s)",
+        name,
+        checkpoint.overdue_marked,
+        checkpoint.due_soon_logged,
+        coordinator_cache_for(db).stats(),
     )
 
     return {
         "checked_at": now.isoformat(),
-        "overdue_marked": len(overdue_tasks),
-        "due_soon_logged": due_soon_count,
+        "overdue_marked": checkpoint.overdue_marked,
+        "due_soon_logged": checkpoint.due_soon_logged,
+    }
+
+
+def list_sweep_org_ids(db: Session) -> list[uuid.UUID]:
+    """Orgs that currently have open tasks inside the sweep window — one shard each."""
+    due_soon_threshold = datetime.now(UTC) + timedelta(hours=48)
+    return list(
+        db.scalars(
+            select(Transaction.org_id)
+            .join(Task, Task.transaction_id == Transaction.id)
+            .where(
+                Task.due_at.isnot(None),
+                Task.due_at <= due_soon_threshold,
+                Task.status.notin_([TaskStatus.done, TaskStatus.overdue]),
+            )
+            .distinct()
+        )
+    )
+
+
+def merge_sweep_results(results: list[dict]) -> dict:
+    """Fold per-shard ``check_deadlines`` summaries into one of the same shape."""
+    checked_at = min((r["checked_at"] for r in results), default=datetime.now(UTC).isoformat())
+    return {
+        "checked_at": checked_at,
+        "overdue_marked": sum(r["overdue_marked"] for r in results),
+        "due_soon_logged": sum(r["due_soon_logged"] for r in results),
     }
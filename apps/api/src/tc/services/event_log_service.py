@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import uuid
+from datetime import datetime
 
+from sqlalchemy import insert, select, tuple_
 from sqlalchemy.orm import Session
 
+from tc.core.pagination import decode_cursor, encode_cursor
 from tc.db.models.event_log import EventLog
 
 
+def create_event_logs(db: Session, rows: list[dict]) -> None:
+    """Bulk-insert event log rows in one executemany."""
+    if not rows:
+        return
+    db.execute(insert(EventLog), rows)
+
+
 def list_event_logs_for_transaction(
     db: Session,
     transaction_id: uuid.UUID,
@@ -30,3 +40,41 @@ def list_event_logs_for_transaction(
         .limit(page_size)
         .all()
     )
+
+
+def list_event_logs_for_transaction_after(
+    db: Session,
+    transaction_id: uuid.UUID,
+    *,
+    event_type: str | None = None,
+    cursor: str | None = None,
+    limit: int = 100,
+) -> tuple[list[EventLog], str | None]:
+    """
+    One keyset page of a transaction's event logs, newest first.
+
+    Served by the (transaction_id, created_at DESC, id DESC) index, or
+    (transaction_id, event_type, created_at) when filtering, so page N costs
+    the same as page 1. Returns the logs and the cursor for the next page
+    (``None`` on the last one).
+    """
+    limit = min(max(1, limit), 100)
+
+    query = (
+        select(EventLog)
+        .where(EventLog.transaction_id == transaction_id)
+        .order_by(EventLog.created_at.desc(), EventLog.id.desc())
+    )
+    if event_type:
+        query = query.where(EventLog.event_type == event_type)
+    if cursor is not None:
+        before_created_at, before_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        query = query.where(
+            tuple_(EventLog.created_at, EventLog.id) < tuple_(before_created_at, before_id)
+        )
+
+    logs = list(db.scalars(query.limit(limit + 1)))
+    if len(logs) <= limit:
+        return logs, None
+    logs = logs[:limit]
+    return logs, encode_cursor([logs[-1].created_at, logs[-1].id])
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import logging
+import time
 import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from tc.core.config import settings
+from tc.db.models.sweep_checkpoint import SweepCheckpoint
 from tc.db.models.task import Task
+from tc.db.models.transaction import Transaction
+from tc.db.models.transaction_health import TransactionHealth
 from tc.domain.enums import TaskSeverity, TaskStatus
 
+logger = logging.getLogger(__name__)
+
+HEALTH_RECOMPUTE_NAME = "health_recompute"
+
 # Severity weights used when computing the health score.
 SEVERITY_WEIGHTS: dict[str, float] = {
     TaskSeverity.critical: 3.0,
@@ -17,14 +31,74 @@ SEVERITY_WEIGHTS: dict[str, float] = {
 }
 
 
-def _weight(severity: str | None) -> float:
-    """Return the numeric weight for a severity level (default: medium)."""
-    return SEVERITY_WEIGHTS.get(severity or TaskSeverity.medium, 1.0)
+@dataclass
+class HealthTally:
+    """The per-transaction aggregate a health score is derived from."""
 
+    overdue_count: int = 0
+    due_soon_count: int = 0
+    overdue_weighted: float = 0.0
+    due_soon_weighted: float = 0.0
+    has_critical_overdue: bool = False
 
-def compute_health_score(db: Session, transaction_id: uuid.UUID) -> dict:
+
+def _open_task():
+    return Task.status.in_([TaskStatus.todo, TaskStatus.in_progress])
+
+
+def _tally_transactions(
+    db: Session, transaction_ids: list[uuid.UUID], now: datetime
+) -> dict[uuid.UUID, HealthTally]:
+    """
+    Tally the tasks of each transaction with one grouped aggregate over ``tasks``.
+
+    A task is overdue if its status says so, or if it is still open and its
+    due date has passed; it is due soon if it is open and due within the next
+    48 hours. Weights come from ``SEVERITY_WEIGHTS`` (unset severity counts as
+    medium). Transactions without tasks get an empty tally.
     """
-    Compute a GREEN / YELLOW / RED health score for a transaction.
+    severity = func.coalesce(Task.severity, TaskSeverity.medium)
+    weight = case(SEVERITY_WEIGHTS, value=severity, else_=1.0)
+    is_overdue = or_(
+        Task.status == TaskStatus.overdue,
+        and_(Task.due_at.isnot(None), Task.due_at <= now, _open_task()),
+    )
+    is_due_soon = and_(
+        _open_task(),
+        Task.due_at > now,
+        Task.due_at <= now + timedelta(hours=48),
+    )
+
+    rows = db.execute(
+        select(
+            Task.transaction_id,
+            func.sum(case((is_overdue, 1), else_=0)).label("overdue_count"),
+            func.sum(case((is_due_soon, 1), else_=0)).label("due_soon_count"),
+            func.sum(case((is_overdue, weight), else_=0.0)).label("overdue_weighted"),
+            func.sum(case((is_due_soon, weight), else_=0.0)).label("due_soon_weighted"),
+            func.max(case((and_(is_overdue, severity == TaskSeverity.critical), 1), else_=0)).label(
+                "has_critical_overdue"
+            ),
+        )
+        .where(Task.transaction_id.in_(transaction_ids))
+        .group_by(Task.transaction_id)
+    )
+
+    tallies = {txn_id: HealthTally() for txn_id in transaction_ids}
+    for row in rows:
+        tallies[row.transaction_id] = HealthTally(
+            overdue_count=int(row.overdue_count),
+            due_soon_count=int(row.due_soon_count),
+            overdue_weighted=float(row.overdue_weighted),
+            due_soon_weighted=float(row.due_soon_weighted),
+            has_critical_overdue=bool(row.has_critical_overdue),
+        )
+    return tallies
+
+
+def score_from_tally(tally: HealthTally) -> dict:
+    """
+    Turn an aggregate into a GREEN / YELLOW / RED score with reasons.
 
     Scoring uses severity weighting:
       - Any *critical* task overdue → instant RED
@@ -32,54 +106,20 @@ def compute_health_score(db: Session, transaction_id: uuid.UUID) -> dict:
       - Any due-soon tasks or weighted overdue score ≥ 1.0 → YELLOW
       - Otherwise → GREEN
     """
-    now = datetime.now(UTC)
-    due_soon_threshold = now + timedelta(hours=48)
-
-    tasks = db.query(Task).filter(Task.transaction_id == transaction_id).all()
-
-    overdue_count = 0
-    due_soon_count = 0
-    overdue_weighted = 0.0
-    due_soon_weighted = 0.0
-    has_critical_overdue = False
     reasons: list[str] = []
-
-    for task in tasks:
-        due_at = task.due_at
-        if due_at is not None and due_at.tzinfo is None:
-            due_at = due_at.replace(tzinfo=UTC)
-
-        is_overdue = task.status == TaskStatus.overdue or (
-            due_at is not None
-            and due_at <= now
-            and task.status in (TaskStatus.todo, TaskStatus.in_progress)
+    if tally.overdue_count > 0:
+        reasons.append(
+            f"{tally.overdue_count} task(s) overdue (weighted score {tally.overdue_weighted:.1f})"
         )
-        if is_overdue:
-            overdue_count += 1
-            overdue_weighted += _weight(task.severity)
-            if (task.severity or TaskSeverity.medium) == TaskSeverity.critical:
-                has_critical_overdue = True
-            continue
-
-        if (
-            due_at is not None
-            and due_at > now
-            and due_at <= due_soon_threshold
-            and task.status in (TaskStatus.todo, TaskStatus.in_progress)
-        ):
-            due_soon_count += 1
-            due_soon_weighted += _weight(task.severity)
-
-    if overdue_count > 0:
-        reasons.append(f"{overdue_count} task(s) overdue (weighted score {overdue_weighted:.1f})")
-    if due_soon_count > 0:
+    if tally.due_soon_count > 0:
         reasons.append(
-            f"{due_soon_count} task(s) due in next 48h (weighted score {due_soon_weighted:.1f})"
+            f"{tally.due_soon_count} task(s) due in next 48h "
+            f"(weighted score {tally.due_soon_weighted:.1f})"
         )
 
-    if has_critical_overdue or overdue_weighted >= 3.0:
+    if tally.has_critical_overdue or tally.overdue_weighted >= 3.0:
         score = "RED"
-    elif overdue_weighted >= 1.0 or due_soon_count > 0:
+    elif tally.overdue_weighted >= 1.0 or tally.due_soon_count > 0:
         score = "YELLOW"
     else:
         score = "GREEN"
@@ -87,3 +127,185 @@ def compute_health_score(db: Session, transaction_id: uuid.UUID) -> dict:
             reasons.append("All tasks on track")
 
     return {"score": score, "reasons": reasons}
+
+
+def compute_health_score(db: Session, transaction_id: uuid.UUID) -> dict:
+    """Compute a GREEN / YELLOW / RED health score for a transaction from its tasks, live."""
+    return compute_health_scores(db, [transaction_id])[transaction_id]
+
+
+def compute_health_scores(
+    db: Session, transaction_ids: Iterable[uuid.UUID]
+) -> dict[uuid.UUID, dict]:
+    """Live health scores for many transactions, from a single aggregate query."""
+    transaction_ids = list(dict.fromkeys(transaction_ids))
+    if not transaction_ids:
+        return {}
+    tallies = _tally_transactions(db, transaction_ids, datetime.now(UTC))
+    return {txn_id: score_from_tally(tally) for txn_id, tally in tallies.items()}
+
+
+def refresh_transaction_health(
+    db: Session,
+    transaction_ids: Iterable[uuid.UUID],
+    *,
+    now: datetime | None = None,
+) -> int:
+    """
+    Recompute and persist the health aggregate of the given transactions.
+
+    Called by every path that changes a task's status or due date (task
+    create/status, timeline generation, deadline sweep transitions), so the
+    stored aggregate and ``Transaction.health_score`` stay current. Only the
+    affected transactions are re-tallied. Does not commit.
+
+    Returns how many ``Transaction.health_score`` values changed.
+    """
+    transaction_ids = list(dict.fromkeys(transaction_ids))
+    if not transaction_ids:
+        return 0
+    now = now or datetime.now(UTC)
+
+    tallies = _tally_transactions(db, transaction_ids, now)
+    stored = {
+        row.transaction_id: row
+        for row in db.query(TransactionHealth).filter(
+            TransactionHealth.transaction_id.in_(transaction_ids)
+        )
+    }
+    current_scores = dict(
+        db.execute(
+            select(Transaction.id, Transaction.health_score).where(
+                Transaction.id.in_(transaction_ids)
+            )
+        ).all()
+    )
+
+    score_updates: list[dict] = []
+    for txn_id, tally in tallies.items():
+        if txn_id not in current_scores:
+            continue
+        row = stored.get(txn_id)
+        if row is None:
+            row = TransactionHealth(transaction_id=txn_id)
+            db.add(row)
+        row.overdue_count = tally.overdue_count
+        row.due_soon_count = tally.due_soon_count
+        row.overdue_weighted = tally.overdue_weighted
+        row.due_soon_weighted = tally.due_soon_weighted
+        row.has_critical_overdue = tally.has_critical_overdue
+        row.computed_at = now
+
+        score = score_from_tally(tally)["score"]
+        if current_scores[txn_id] != score:
+            score_updates.append({"id": txn_id, "health_score": score})
+
+    if score_updates:
+        db.execute(update(Transaction), score_updates)
+    db.flush()
+    return len(score_updates)
+
+
+def get_health_score(db: Session, transaction_id: uuid.UUID) -> dict:
+    """Read the persisted health score of a transaction — one indexed row lookup.
+
+    Transactions that have never been scored are computed and stored on first read.
+    """
+    row = (
+        db.query(TransactionHealth)
+        .filter(TransactionHealth.transaction_id == transaction_id)
+        .first()
+    )
+    if row is None:
+        refresh_transaction_health(db, [transaction_id])
+        db.commit()
+        row = (
+            db.query(TransactionHealth)
+            .filter(TransactionHealth.transaction_id == transaction_id)
+            .one()
+        )
+    return score_from_tally(
+        HealthTally(
+            overdue_count=row.overdue_count,
+            due_soon_count=row.due_soon_count,
+            overdue_weighted=row.overdue_weighted,
+            due_soon_weighted=row.due_soon_weighted,
+            has_critical_overdue=row.has_critical_overdue,
+        )
+    )
+
+
+def _crossed_thresholds(db: Session, since: datetime | None, now: datetime) -> list[uuid.UUID]:
+    """
+    Transactions with an open task whose due date crossed a scoring threshold in (since, now].
+
+    A task turns overdue when ``due_at`` passes and due-soon when ``due_at``
+    comes within 48h, so both are plain ``due_at`` ranges served by the
+    ``(due_at, id)`` index. On the first run every open task up to the due-soon
+    horizon counts.
+    """
+    horizon = now + timedelta(hours=48)
+    if since is None:
+        window = Task.due_at <= horizon
+    else:
+        window = or_(
+            and_(Task.due_at > since, Task.due_at <= now),
+            and_(Task.due_at > since + timedelta(hours=48), Task.due_at <= horizon),
+        )
+    return list(
+        db.scalars(
+            select(Task.transaction_id)
+            .where(Task.due_at.isnot(None), window, _open_task())
+            .distinct()
+        )
+    )
+
+
+def recompute_stale_health(db: Session, *, batch_size: int | None = None) -> dict:
+    """
+    Refresh health scores that went stale because time passed, not because a task changed.
+
+    Only transactions whose tasks crossed the overdue or due-soon threshold
+    since the previous successful run are re-scored, ``batch_size`` at a time
+    (``HEALTH_RECOMPUTE_BATCH_SIZE``), each batch bulk-updated and committed.
+    The run time is recorded on the ``health_recompute`` sweep checkpoint; a
+    failed run leaves it untouched so the next run covers the gap.
+    """
+    batch_size = batch_size or settings.HEALTH_RECOMPUTE_BATCH_SIZE
+    started = time.perf_counter()
+    now = datetime.now(UTC)
+
+    if (
+        db.query(SweepCheckpoint.id).filter(SweepCheckpoint.name == HEALTH_RECOMPUTE_NAME).first()
+        is None
+    ):
+        try:
+            with db.begin_nested():
+                db.add(SweepCheckpoint(name=HEALTH_RECOMPUTE_NAME))
+        except IntegrityError:
+            logger.debug("recompute_health: checkpoint created concurrently")
+    checkpoint = (
+        db.query(SweepCheckpoint).filter(SweepCheckpoint.name == HEALTH_RECOMPUTE_NAME).one()
+    )
+    since = checkpoint.run_started_at if checkpoint.completed_at is not None else None
+
+    transaction_ids = _crossed_thresholds(db, since, now)
+    scores_changed = 0
+    for i in range(0, len(transaction_ids), batch_size):
+        scores_changed += refresh_transaction_health(
+            db, transaction_ids[i : i + batch_size], now=now
+        )
+        db.commit()
+
+    checkpoint.run_started_at = now
+    checkpoint.completed_at = datetime.now(UTC)
+    db.commit()
+
+    result = {
+        "checked_at": now.isoformat(),
+        "transactions_checked": len(transaction_ids),
+        "scores_changed": scores_changed,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+    logger.info("recompute_health: %s", result)
+    return result
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from tc.db.models.task import Task
 from tc.domain.enums import TaskStatus
 from tc.services.audit_service import create_audit_event
+from tc.services.health_service import refresh_transaction_health
 
 
 class TaskNotFoundError(ValueError):
@@ -57,8 +58,10 @@ def create_task(
         action="task.created",
         entity_type="task",
         entity_id=task.id,
+        transaction_id=transaction_id,
         detail=f"Task '{title}' created",
     )
+    refresh_transaction_health(db, [transaction_id])
     if commit:
         db.commit()
         db.refresh(task)
@@ -96,8 +99,10 @@ def update_task_status(
         action="task.status_changed",
         entity_type="task",
         entity_id=task.id,
+        transaction_id=task.transaction_id,
         detail=f"Status changed from '{old_status}' to '{new_status}'",
     )
+    refresh_transaction_health(db, [task.transaction_id])
     db.commit()
     db.refresh(task)
     return task
@@ -128,6 +133,7 @@ def assign_task(
         action="task.assigned",
         entity_type="task",
         entity_id=task.id,
+        transaction_id=task.transaction_id,
         detail=f"Task assigned to user {assignee_id}",
     )
     db.commit()
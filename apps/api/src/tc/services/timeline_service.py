@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 from tc.db.models.task import Task
 from tc.db.models.timeline import TimelineItem
 from tc.domain.enums import TaskStatus
+from tc.services.health_service import refresh_transaction_health
 
 # Load the timeline templates JSON file
 TEMPLATE_FILE = Path(__file__).parent.parent / "core" / "timeline_templates.json"
@@ -63,6 +64,8 @@ def generate_default_timeline(
         )
         db.add(item)
 
+    db.flush()
+    refresh_transaction_health(db, [transaction_id])
     db.commit()
     return tasks
 
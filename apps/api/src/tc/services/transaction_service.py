@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 
+from sqlalchemy import and_, exists, or_, select, tuple_
 from sqlalchemy.orm import Session
 
+from tc.core.pagination import decode_cursor, encode_cursor
 from tc.db.models.membership import Membership
+from tc.db.models.task import Task
 from tc.db.models.transaction import Transaction, TransactionStatus
 
 
@@ -36,13 +39,120 @@ def get_transaction(db: Session, transaction_id: uuid.UUID) -> Transaction | Non
     return db.query(Transaction).filter(Transaction.id == transaction_id).first()
 
 
-def list_user_transactions(db: Session, user_id: uuid.UUID) -> list[Transaction]:
-    org_ids = [
-        m.org_id for m in db.query(Membership.org_id).filter(Membership.user_id == user_id).all()
-    ]
-    if not org_ids:
+def get_transaction_for_user(
+    db: Session, transaction_id: uuid.UUID, user_id: uuid.UUID
+) -> tuple[Transaction | None, bool]:
+    """Fetch a transaction and whether *user_id* belongs to its org, in one query."""
+    is_member = exists().where(
+        Membership.org_id == Transaction.org_id, Membership.user_id == user_id
+    )
+    row = db.execute(
+        select(Transaction, is_member.label("is_member")).where(Transaction.id == transaction_id)
+    ).first()
+    if row is None:
+        return None, False
+    return row.Transaction, bool(row.is_member)
+
+
+def list_transaction_tasks(
+    db: Session,
+    transaction_id: uuid.UUID,
+    *,
+    limit: int | None = None,
+    cursor: str | None = None,
+) -> tuple[list[Task], str | None]:
+    """
+    Tasks of a transaction ordered by (due_at, id), undated tasks last.
+
+    With ``limit`` the result is one keyset page and the second element is the
+    cursor for the next page (``None`` on the last one). Raises
+    ``InvalidCursorError`` for a cursor not produced here.
+    """
+    query = (
+        select(Task)
+        .where(Task.transaction_id == transaction_id)
+        .order_by(Task.due_at.asc().nulls_last(), Task.id)
+    )
+    if cursor is not None:
+        after_due_at, after_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        if after_due_at is None:
+            query = query.where(Task.due_at.is_(None), Task.id > after_id)
+        else:
+            query = query.where(
+                or_(
+                    Task.due_at > after_due_at,
+                    and_(Task.due_at == after_due_at, Task.id > after_id),
+                    Task.due_at.is_(None),
+                )
+            )
+    if limit is None:
+        return list(db.scalars(query)), None
+
+    tasks = list(db.scalars(query.limit(limit + 1)))
+    if len(tasks) <= limit:
+        return tasks, None
+    tasks = tasks[:limit]
+    return tasks, encode_cursor([tasks[-1].due_at, tasks[-1].id])
+
+
+def list_user_transactions(
+    db: Session,
+    user_id: uuid.UUID,
+    *,
+    limit: int,
+    cursor: str | None = None,
+    status: str | None = None,
+    health_score: str | None = None,
+    close_date_from: date | None = None,
+    close_date_to: date | None = None,
+) -> tuple[list[Transaction], str | None]:
+    """
+    One keyset page of the transactions in *user_id*'s orgs, newest first.
+
+    Ordered by (created_at, id) descending; the second element is the cursor
+    for the next page (``None`` on the last one). Raises ``InvalidCursorError``
+    for a cursor not produced here.
+    """
+    member_orgs = select(Membership.org_id).where(Membership.user_id == user_id)
+    query = (
+        select(Transaction)
+        .where(Transaction.org_id.in_(member_orgs))
+        .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+    )
+    if status is not None:
+        query = query.where(Transaction.status == status)
+    if health_score is not None:
+        query = query.where(Transaction.health_score == health_score)
+    if close_date_from is not None:
+        query = query.where(Transaction.close_date >= close_date_from)
+    if close_date_to is not None:
+        query = query.where(Transaction.close_date <= close_date_to)
+    if cursor is not None:
+        before_created_at, before_id = decode_cursor(cursor, datetime.fromisoformat, uuid.UUID)
+        query = query.where(
+            tuple_(Transaction.created_at, Transaction.id) < tuple_(before_created_at, before_id)
+        )
+
+    txns = list(db.scalars(query.limit(limit + 1)))
+    if len(txns) <= limit:
+        return txns, None
+    txns = txns[:limit]
+    return txns, encode_cursor([txns[-1].created_at, txns[-1].id])
+
+
+def filter_accessible_transaction_ids(
+    db: Session, user_id: uuid.UUID, transaction_ids: list[uuid.UUID]
+) -> list[uuid.UUID]:
+    """The subset of *transaction_ids* in orgs *user_id* belongs to, in one query."""
+    if not transaction_ids:
         return []
-    return db.query(Transaction).filter(Transaction.org_id.in_(org_ids)).all()
+    return list(
+        db.scalars(
+            select(Transaction.id)
+            .join(Membership, Membership.org_id == Transaction.org_id)
+            .where(Transaction.id.in_(transaction_ids), Membership.user_id == user_id)
+        )
+    )
 
 
 def user_belongs_to_org(db: Session, user_id: uuid.UUID, org_id: uuid.UUID) -> bool:
@@ -98,3 +98,77 @@ def test_list_org_audit_requires_admin(db, client, seed_user):
     r = client.get(f"/api/v1/audit?org_id={str(org.id)}", headers=headers)
     assert r.status_code == 403
     assert r.json()["detail"] == "Role 'admin' required"
+
+
+def _seed_events(db, org, n, *, action="task.created"):
+    from datetime import UTC, datetime, timedelta
+
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    events = [
+        AuditEvent(
+            id=uuid.uuid4(),
+            org_id=org.id,
+            action=action,
+            entity_type="task",
+            detail=f"Event {i}",
+            # Pairs share a timestamp so the id tie-breaker is exercised.
+            created_at=base + timedelta(minutes=i // 2),
+        )
+        for i in range(n)
+    ]
+    db.add_all(events)
+    db.commit()
+    return events
+
+
+def test_list_org_audit_cursor_pages(db, client, auth_header, seed_user):
+    _, org = seed_user
+    _seed_events(db, org, 7)
+
+    details, cursor, pages = [], None, 0
+    while True:
+        params = {"org_id": str(org.id), "page_size": 3}
+        if cursor is not None:
+            params["cursor"] = cursor
+        r = client.get("/api/v1/audit", params=params, headers=auth_header)
+        assert r.status_code == 200
+        data = r.json()
+        assert data["total"] == 7
+        details += [item["detail"] for item in data["items"]]
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(details) == len(set(details)) == 7
+    assert details[0] == "Event 6"
+
+    # Legacy OFFSET paging returns the same order.
+    r = client.get(
+        "/api/v1/audit",
+        params={"org_id": str(org.id), "page": 2, "page_size": 3},
+        headers=auth_header,
+    )
+    assert [item["detail"] for item in r.json()["items"]] == details[3:6]
+
+
+def test_list_org_audit_total_is_optional_and_cached(db, client, auth_header, seed_user):
+    _, org = seed_user
+    _seed_events(db, org, 2)
+
+    url = f"/api/v1/audit?org_id={org.id}"
+    r = client.get(f"{url}&include_total=false", headers=auth_header)
+    assert r.json()["total"] is None
+    assert len(r.json()["items"]) == 2
+
+    assert client.get(url, headers=auth_header).json()["total"] == 2
+    _seed_events(db, org, 1)
+    # Served from the count cache until its TTL expires.
+    assert client.get(url, headers=auth_header).json()["total"] == 2
+
+
+def test_list_org_audit_rejects_bad_cursor(client, auth_header, seed_user):
+    _, org = seed_user
+    r = client.get(f"/api/v1/audit?org_id={org.id}&cursor=%21%21", headers=auth_header)
+    assert r.status_code == 400
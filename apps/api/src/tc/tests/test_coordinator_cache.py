@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import uuid
+
+from tc.core.cache import TTLCache
+from tc.db.models.membership import Membership
+from tc.db.models.user import User
+from tc.domain.coordinator_cache import CoordinatorCache, coordinator_cache_for
+
+
+def _add_admin(db, org, email):
+    user = User(id=uuid.uuid4(), email=email, full_name="Admin", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(Membership(id=uuid.uuid4(), org_id=org.id, user_id=user.id, role="admin"))
+    db.commit()
+    return user
+
+
+def test_second_lookup_is_a_hit(db, seed_user):
+    user, org = seed_user
+    cache = CoordinatorCache(shared=TTLCache(ttl=0, maxsize=0))
+
+    assert cache.resolve(db, [org.id]) == {org.id: user.id}
+    assert cache.resolve(db, [org.id]) == {org.id: user.id}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_shared_tier_serves_new_sessions(db, seed_user):
+    user, org = seed_user
+    shared = TTLCache(ttl=60, maxsize=100)
+
+    CoordinatorCache(shared=shared).resolve(db, [org.id])
+    fresh = CoordinatorCache(shared=shared)
+
+    assert fresh.resolve(db, [org.id]) == {org.id: user.id}
+    assert fresh.stats()["hits"] == 1
+    assert fresh.stats()["misses"] == 0
+
+
+def test_membership_change_invalidates(db, seed_user):
+    user, org = seed_user
+    cache = coordinator_cache_for(db)
+    assert cache.resolve(db, [org.id])[org.id] == user.id
+
+    membership = db.query(Membership).filter(Membership.user_id == user.id).one()
+    membership.role = "member"
+    db.commit()
+    other = _add_admin(db, org, "second@test.local")
+
+    assert cache.resolve(db, [org.id])[org.id] == other.id
+
+
+def test_org_without_admin_is_cached_as_none(db, seed_user):
+    cache = CoordinatorCache(shared=TTLCache(ttl=0, maxsize=0))
+    org_id = uuid.uuid4()
+
+    assert cache.resolve(db, [org_id]) == {org_id: None}
+    assert cache.resolve(db, [org_id]) == {org_id: None}
+    assert cache.stats()["hits"] == 1
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(ttl=10, maxsize=2, clock=lambda: now[0])
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_stats_endpoint(client, auth_header):
+    r = client.get("/api/v1/admin/cache-stats", headers=auth_header)
+    assert r.status_code == 200
+    assert {"hits", "misses", "hit_rate", "shared"} <= set(r.json()["coordinators"])
+
+
+def test_cache_stats_requires_auth(client):
+    r = client.get("/api/v1/admin/cache-stats")
+    assert r.status_code == 401
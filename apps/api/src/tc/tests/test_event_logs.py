@@ -100,3 +100,53 @@ def test_list_events_unauthorized(db, client, seed_user):
     r = client.get(f"/api/v1/transactions/{txn2.id}/events", headers=headers)
     assert r.status_code == 403
     assert r.json()["detail"] == "Not a member of this organisation"
+
+
+def test_list_events_cursor_pages(db, client, auth_header, seed_user):
+    from datetime import UTC, datetime, timedelta
+
+    _, org = seed_user
+    txn = Transaction(id=uuid.uuid4(), org_id=org.id, title="Busy deal", status="active")
+    db.add(txn)
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    db.add_all(
+        [
+            EventLog(
+                id=uuid.uuid4(),
+                transaction_id=txn.id,
+                event_type="task.overdue" if i % 2 else "task.due_soon",
+                entity_type="task",
+                detail=f"Event {i}",
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            for i in range(7)
+        ]
+    )
+    db.commit()
+
+    def walk(**params):
+        details, cursor = [], None
+        while True:
+            query = {"page_size": 2, **params}
+            if cursor is not None:
+                query["cursor"] = cursor
+            r = client.get(
+                f"/api/v1/transactions/{txn.id}/events", params=query, headers=auth_header
+            )
+            assert r.status_code == 200
+            details += [log["detail"] for log in r.json()]
+            cursor = r.headers.get("X-Next-Cursor")
+            if cursor is None:
+                return details
+
+    details = walk()
+    assert len(details) == len(set(details)) == 7
+    assert details[0] == "Event 6"
+    assert walk(event_type="task.overdue") == ["Event 5", "Event 3", "Event 1"]
+
+    r = client.get(
+        f"/api/v1/transactions/{txn.id}/events",
+        params={"page": 2, "page_size": 2},
+        headers=auth_header,
+    )
+    assert [log["detail"] for log in r.json()] == details[2:4]
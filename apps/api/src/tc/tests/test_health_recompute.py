@@ -54,3 +54,225 @@ def test_health_recompute_on_task_status_change(db, client, auth_header, seed_us
     # Verify health endpoint returns GREEN
     r_health = client.get(f"/api/v1/transactions/{txn.id}/health", headers=auth_header)
     assert r_health.json()["score"] == "GREEN"
+
+
+def _txn(db, org):
+    txn = Transaction(
+        id=uuid.uuid4(), org_id=org.id, title="Aggregate Txn", status="active", health_score="GREEN"
+    )
+    db.add(txn)
+    db.commit()
+    return txn
+
+
+def test_task_create_updates_persisted_aggregate(db, client, auth_header, seed_user):
+    from tc.db.models.transaction_health import TransactionHealth
+
+    _, org = seed_user
+    txn = _txn(db, org)
+
+    due_at = (datetime.now(UTC) + timedelta(hours=24)).isoformat()
+    r = client.post(
+        f"/api/v1/transactions/{txn.id}/tasks",
+        json={"title": "Due tomorrow", "due_at": due_at},
+        headers=auth_header,
+    )
+    assert r.status_code == 201
+
+    db.expire_all()
+    row = db.query(TransactionHealth).filter(TransactionHealth.transaction_id == txn.id).one()
+    assert row.due_soon_count == 1
+    assert row.due_soon_weighted == 1.0
+    assert row.overdue_count == 0
+    assert db.get(Transaction, txn.id).health_score == "YELLOW"
+
+
+def test_status_change_updates_aggregate(db, client, auth_header, seed_user):
+    from tc.db.models.transaction_health import TransactionHealth
+
+    _, org = seed_user
+    txn = _txn(db, org)
+    task = Task(
+        id=uuid.uuid4(),
+        transaction_id=txn.id,
+        title="Late",
+        status="overdue",
+        due_at=datetime.now(UTC) - timedelta(days=1),
+        severity="high",
+    )
+    db.add(task)
+    db.commit()
+
+    r = client.get(f"/api/v1/transactions/{txn.id}/health", headers=auth_header)
+    assert r.json()["score"] == "YELLOW"
+    row = db.query(TransactionHealth).filter(TransactionHealth.transaction_id == txn.id).one()
+    assert row.overdue_count == 1
+    assert row.overdue_weighted == 2.0
+
+    client.patch(f"/api/v1/tasks/{task.id}/status", json={"status": "done"}, headers=auth_header)
+
+    db.expire_all()
+    row = db.query(TransactionHealth).filter(TransactionHealth.transaction_id == txn.id).one()
+    assert row.overdue_count == 0
+    assert client.get(f"/api/v1/transactions/{txn.id}/health", headers=auth_header).json() == {
+        "score": "GREEN",
+        "reasons": ["All tasks on track"],
+    }
+
+
+def test_persisted_score_matches_live_computation(db, seed_user):
+    from tc.services.health_service import compute_health_score, get_health_score
+
+    _, org = seed_user
+    txn = _txn(db, org)
+    db.add_all(
+        [
+            Task(
+                id=uuid.uuid4(),
+                transaction_id=txn.id,
+                title=f"Task {i}",
+                status="todo",
+                due_at=datetime.now(UTC) + timedelta(hours=hours),
+                severity=severity,
+            )
+            for i, (hours, severity) in enumerate([(-5, "low"), (10, "critical"), (24 * 5, "high")])
+        ]
+    )
+    db.commit()
+
+    assert get_health_score(db, txn.id) == compute_health_score(db, txn.id)
+
+
+def _seed_tasks(db, txn, specs):
+    db.add_all(
+        [
+            Task(
+                id=uuid.uuid4(),
+                transaction_id=txn.id,
+                title=f"Task {i}",
+                status=status,
+                due_at=datetime.now(UTC) + timedelta(hours=hours) if hours is not None else None,
+                severity=severity,
+            )
+            for i, (status, hours, severity) in enumerate(specs)
+        ]
+    )
+    db.commit()
+
+
+def test_batch_scores_match_single_scores(db, seed_user):
+    from tc.services.health_service import compute_health_score, compute_health_scores
+
+    _, org = seed_user
+    scenarios = [
+        [],
+        [("todo", 24 * 7, "high"), ("done", -24, "critical")],
+        [("todo", 12, None), ("in_progress", 30, "low")],
+        [("overdue", -24, "medium"), ("todo", -2, "low"), ("todo", None, "high")],
+        [("todo", -1, "high"), ("in_progress", -3, "medium")],
+        [("overdue", -24, "critical"), ("todo", 5, "critical")],
+    ]
+    txns = []
+    for specs in scenarios:
+        txn = _txn(db, org)
+        _seed_tasks(db, txn, specs)
+        txns.append(txn)
+
+    batch = compute_health_scores(db, [t.id for t in txns])
+    assert [batch[t.id]["score"] for t in txns] == [
+        "GREEN",
+        "GREEN",
+        "YELLOW",
+        "YELLOW",
+        "RED",
+        "RED",
+    ]
+    for txn in txns:
+        assert batch[txn.id] == compute_health_score(db, txn.id)
+
+
+def test_batch_health_endpoint(db, client, auth_header, seed_user):
+    from tc.db.models.org import Org
+
+    _, org = seed_user
+    green = _txn(db, org)
+    red = _txn(db, org)
+    _seed_tasks(db, red, [("overdue", -24, "critical")])
+
+    other_org = Org(id=uuid.uuid4(), name="Elsewhere", slug="elsewhere")
+    db.add(other_org)
+    db.commit()
+    hidden = _txn(db, other_org)
+
+    ids = ",".join(str(t.id) for t in (green, red, hidden))
+    r = client.get(f"/api/v1/transactions/health?ids={ids}", headers=auth_header)
+    assert r.status_code == 200
+    body = r.json()
+    assert set(body) == {str(green.id), str(red.id)}
+    assert body[str(green.id)]["score"] == "GREEN"
+    assert body[str(red.id)]["score"] == "RED"
+
+    r = client.get("/api/v1/transactions/health?ids=not-a-uuid", headers=auth_header)
+    assert r.status_code == 400
+
+
+class TestRecomputeStaleHealth:
+    def test_first_run_scores_open_tasks_in_window(self, db, seed_user):
+        from tc.services.health_service import recompute_stale_health
+
+        _, org = seed_user
+        soon = _txn(db, org)
+        later = _txn(db, org)
+        _seed_tasks(db, soon, [("todo", 6, "high")])
+        _seed_tasks(db, later, [("todo", 24 * 10, "high")])
+
+        result = recompute_stale_health(db)
+
+        assert result["transactions_checked"] == 1
+        assert result["scores_changed"] == 1
+        assert result["duration_ms"] >= 0
+        db.expire_all()
+        assert db.get(Transaction, soon.id).health_score == "YELLOW"
+        assert db.get(Transaction, later.id).health_score == "GREEN"
+
+    def test_only_rescans_threshold_crossings_since_last_run(self, db, seed_user):
+        from tc.db.models.sweep_checkpoint import SweepCheckpoint
+        from tc.services.health_service import HEALTH_RECOMPUTE_NAME, recompute_stale_health
+
+        _, org = seed_user
+        recompute_stale_health(db)
+        assert recompute_stale_health(db)["transactions_checked"] == 0
+
+        # Pretend the last run was two hours ago: a task due an hour ago crossed into
+        # overdue and one due in 47h crossed into due-soon since then; one due in 3h
+        # was already due-soon at the last run and one in 5 days is still out of range.
+        checkpoint = (
+            db.query(SweepCheckpoint).filter(SweepCheckpoint.name == HEALTH_RECOMPUTE_NAME).one()
+        )
+        checkpoint.run_started_at = datetime.now(UTC) - timedelta(hours=2)
+        db.commit()
+
+        overdue, due_soon, unchanged, far = (_txn(db, org) for _ in range(4))
+        _seed_tasks(db, overdue, [("todo", -1, "critical")])
+        _seed_tasks(db, due_soon, [("in_progress", 47, "medium")])
+        _seed_tasks(db, unchanged, [("todo", 3, "medium")])
+        _seed_tasks(db, far, [("todo", 24 * 5, "medium")])
+
+        result = recompute_stale_health(db, batch_size=1)
+
+        assert result["transactions_checked"] == 2
+        assert result["scores_changed"] == 2
+        db.expire_all()
+        assert db.get(Transaction, overdue.id).health_score == "RED"
+        assert db.get(Transaction, due_soon.id).health_score == "YELLOW"
+        assert db.get(Transaction, unchanged.id).health_score == "GREEN"
+
+    def test_admin_endpoint(self, client, auth_header):
+        r = client.post("/api/v1/admin/recompute-health", headers=auth_header)
+        assert r.status_code == 200
+        assert set(r.json()) == {
+            "checked_at",
+            "transactions_checked",
+            "scores_changed",
+            "duration_ms",
+        }
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from tc.domain.rule_registry import (
+    DEFAULT_RULES_FILE,
+    RuleDef,
+    RuleRegistryLoader,
+    compile_rules,
+    get_rule_registry,
+)
+
+
+def _rule(name="r1", trigger="task.overdue", template="Follow up '{task_title}'", severity="high"):
+    return {
+        "name": name,
+        "trigger": trigger,
+        "task_title_template": template,
+        "task_category": "escalation",
+        "task_severity": severity,
+    }
+
+
+def _write(path, rules):
+    path.write_text(json.dumps({"rules": rules}))
+    # Bump mtime explicitly; some filesystems have coarse timestamps.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_default_registry_indexes_by_trigger():
+    registry = get_rule_registry()
+
+    assert [r.rule.name for r in registry.rules_for("task.overdue")] == ["overdue_escalation"]
+    assert registry.rules_for("no.such.trigger") == ()
+    assert registry.checksum is not None
+
+
+def test_compiled_template_renders_title():
+    registry = compile_rules([RuleDef(**_rule())])
+
+    (compiled,) = registry.rules_for("task.overdue")
+    assert compiled.render_title(task_title="Inspection") == "Follow up 'Inspection'"
+
+
+@pytest.mark.parametrize(
+    "bad_rule",
+    [
+        _rule(template="Follow up '{title}'"),
+        _rule(severity="urgent"),
+    ],
+)
+def test_invalid_rules_are_rejected(bad_rule):
+    with pytest.raises(ValueError):
+        compile_rules([RuleDef(**bad_rule)])
+
+
+def test_duplicate_rule_names_are_rejected():
+    with pytest.raises(ValueError):
+        compile_rules([RuleDef(**_rule()), RuleDef(**_rule(trigger="task.due_soon"))])
+
+
+def test_hot_reload_on_checksum_change(tmp_path):
+    path = tmp_path / "rules.json"
+    _write(path, [_rule()])
+    loader = RuleRegistryLoader(path)
+
+    first = loader.get()
+    assert loader.get() is first
+
+    _write(path, [_rule(), _rule(name="r2", trigger="task.due_soon")])
+    second = loader.get()
+
+    assert second is not first
+    assert second.checksum != first.checksum
+    assert [r.rule.name for r in second.rules_for("task.due_soon")] == ["r2"]
+
+
+def test_invalid_reload_keeps_previous_registry(tmp_path):
+    path = tmp_path / "rules.json"
+    _write(path, [_rule()])
+    loader = RuleRegistryLoader(path)
+    first = loader.get()
+
+    _write(path, [_rule(severity="urgent")])
+
+    assert loader.get() is first
+
+
+def test_default_rules_file_is_valid():
+    registry = RuleRegistryLoader(DEFAULT_RULES_FILE).get()
+
+    assert len(registry) == 3
@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 
 from tc.db.models.task import Task
 from tc.db.models.transaction import Transaction
-from tc.domain.rules import build_dedupe_key, evaluate_rules
+from tc.domain.rules import build_dedupe_key, evaluate_rules, evaluate_rules_batch
 
 
 def test_evaluate_rules_due_soon(db, seed_user):
@@ -86,3 +86,55 @@ def test_evaluate_rules_idempotent(db, seed_user):
 
     created_tasks_2 = evaluate_rules(db, trigger="task.due_soon", source_task=task)
     assert len(created_tasks_2) == 0
+
+
+def test_evaluate_rules_batch_creates_one_task_per_source(db, seed_user):
+    user, org = seed_user
+    txn = Transaction(
+        id=uuid.uuid4(), org_id=org.id, title="123 Test St", status="active", health_score="GREEN"
+    )
+    db.add(txn)
+    sources = [
+        Task(
+            id=uuid.uuid4(),
+            transaction_id=txn.id,
+            title=f"Overdue {i}",
+            status="overdue",
+            due_at=datetime.now(UTC),
+        )
+        for i in range(3)
+    ]
+    db.add_all(sources)
+    db.commit()
+
+    created = evaluate_rules_batch(db, trigger="task.overdue", source_tasks=sources)
+
+    assert sorted(t.title for t in created) == [
+        "ESCALATION: 'Overdue 0' is overdue",
+        "ESCALATION: 'Overdue 1' is overdue",
+        "ESCALATION: 'Overdue 2' is overdue",
+    ]
+    assert all(t.assignee_id == user.id for t in created)
+
+
+def test_evaluate_rules_batch_skips_existing_dedupe_keys(db, seed_user):
+    user, org = seed_user
+    txn = Transaction(
+        id=uuid.uuid4(), org_id=org.id, title="123 Test St", status="active", health_score="GREEN"
+    )
+    db.add(txn)
+    first = Task(id=uuid.uuid4(), transaction_id=txn.id, title="First", status="todo")
+    second = Task(id=uuid.uuid4(), transaction_id=txn.id, title="Second", status="todo")
+    db.add_all([first, second])
+    db.commit()
+
+    evaluate_rules(db, trigger="task.due_soon", source_task=first)
+    created = evaluate_rules_batch(db, trigger="task.due_soon", source_tasks=[first, second])
+
+    assert [t.dedupe_key for t in created] == [
+        build_dedupe_key("due_soon_reminder", "task.due_soon", second.id)
+    ]
+
+
+def test_evaluate_rules_batch_unknown_trigger(db, seed_user):
+    assert evaluate_rules_batch(db, trigger="no.such.trigger", source_tasks=[]) == []
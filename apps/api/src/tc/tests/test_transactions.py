@@ -99,6 +99,67 @@ class TestListTransactions:
         assert r.status_code == 200
         assert r.json() == []
 
+    def _seed_many(self, db, org, n):
+        import uuid
+        from datetime import UTC, date, datetime, timedelta
+
+        from tc.db.models.transaction import Transaction
+
+        base = datetime(2026, 1, 1, tzinfo=UTC)
+        txns = [
+            Transaction(
+                id=uuid.uuid4(),
+                org_id=org.id,
+                title=f"Deal {i}",
+                status="active" if i % 2 else "draft",
+                health_score="RED" if i % 3 == 0 else "GREEN",
+                close_date=date(2026, 3, 1) + timedelta(days=i),
+                # Pairs share a timestamp so the id tie-breaker is exercised.
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            for i in range(n)
+        ]
+        db.add_all(txns)
+        db.commit()
+        return txns
+
+    def test_list_keyset_pages_newest_first(self, db, client, auth_header, seed_user):
+        _, org = seed_user
+        self._seed_many(db, org, 7)
+
+        titles, cursor = [], None
+        while True:
+            params = {"limit": 3} if cursor is None else {"limit": 3, "cursor": cursor}
+            r = client.get("/api/v1/transactions", params=params, headers=auth_header)
+            assert r.status_code == 200
+            titles += [t["title"] for t in r.json()]
+            cursor = r.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert len(titles) == len(set(titles)) == 7
+        assert titles[0] == "Deal 6"
+
+    def test_list_filters(self, db, client, auth_header, seed_user):
+        _, org = seed_user
+        self._seed_many(db, org, 6)
+
+        def titles(**params):
+            r = client.get("/api/v1/transactions", params=params, headers=auth_header)
+            assert r.status_code == 200
+            return {t["title"] for t in r.json()}
+
+        assert titles(status="active") == {"Deal 1", "Deal 3", "Deal 5"}
+        assert titles(health_score="RED") == {"Deal 0", "Deal 3"}
+        assert titles(close_date_from="2026-03-02", close_date_to="2026-03-03") == {
+            "Deal 1",
+            "Deal 2",
+        }
+
+    def test_list_rejects_bad_cursor(self, client, auth_header, seed_user):
+        r = client.get("/api/v1/transactions", params={"cursor": "@@"}, headers=auth_header)
+        assert r.status_code == 400
+
 
 class TestTimelineService:
     """Verify that generate_default_timeline produces tasks + timeline items."""
@@ -180,6 +241,75 @@ class TestGetTasks:
         assert tasks[0]["status"] == "todo"
         assert tasks[0]["due_at"] is not None
 
+    def test_tasks_keyset_pages(self, db, client, auth_header, seed_user):
+        import uuid
+
+        from tc.db.models.task import Task
+        from tc.db.models.transaction import Transaction
+        from tc.services.timeline_service import generate_default_timeline
+
+        _, org = seed_user
+        txn = Transaction(id=uuid.uuid4(), org_id=org.id, title="Paged tasks")
+        db.add(txn)
+        db.add(Task(id=uuid.uuid4(), transaction_id=txn.id, title="Undated"))
+        db.commit()
+        generate_default_timeline(db, txn.id)
+
+        titles, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+            r = client.get(
+                f"/api/v1/transactions/{txn.id}/tasks", params=params, headers=auth_header
+            )
+            assert r.status_code == 200
+            assert len(r.json()) <= 2
+            titles += [t["title"] for t in r.json()]
+            pages += 1
+            cursor = r.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len(titles) == len(set(titles)) == 6
+        assert titles[0] == "Review contract"
+        assert titles[-1] == "Undated"
+
+        unpaged = client.get(f"/api/v1/transactions/{txn.id}/tasks", headers=auth_header)
+        assert [t["title"] for t in unpaged.json()] == titles
+        assert "X-Next-Cursor" not in unpaged.headers
+
+    def test_tasks_rejects_bad_cursor(self, db, client, auth_header, seed_user):
+        import uuid
+
+        from tc.db.models.transaction import Transaction
+
+        _, org = seed_user
+        txn = Transaction(id=uuid.uuid4(), org_id=org.id, title="Bad cursor")
+        db.add(txn)
+        db.commit()
+
+        r = client.get(
+            f"/api/v1/transactions/{txn.id}/tasks",
+            params={"limit": 2, "cursor": "not-a-cursor"},
+            headers=auth_header,
+        )
+        assert r.status_code == 400
+
+    def test_tasks_forbidden_for_other_org(self, db, client, auth_header, seed_user):
+        import uuid
+
+        from tc.db.models.org import Org
+        from tc.db.models.transaction import Transaction
+
+        other = Org(id=uuid.uuid4(), name="Other", slug="other")
+        txn = Transaction(id=uuid.uuid4(), org_id=other.id, title="Not mine")
+        db.add_all([other, txn])
+        db.commit()
+
+        assert client.get(f"/api/v1/transactions/{txn.id}", headers=auth_header).status_code == 403
+        r = client.get(f"/api/v1/transactions/{txn.id}/tasks", headers=auth_header)
+        assert r.status_code == 403
+
     def test_tasks_not_found(self, client, auth_header, seed_user):
         import uuid
 
@@ -1,2 +1,3 @@
 # Beat schedule is now configured directly in celery_app.py
-# via settings.DEADLINE_CHECK_MINUTES.
+# via settings.DEADLINE_CHECK_MINUTES (and DEADLINE_SWEEP_FANOUT for per-org sharding)
+# and settings.HEALTH_RECOMPUTE_MINUTES.
@@ -12,8 +12,12 @@ celery_app.autodiscover_tasks(["tc.workers.tasks"])
 
 celery_app.conf.beat_schedule = {
     "check-deadlines": {
-        "task": "tc.check_deadlines",
+        "task": "tc.fan_out_deadlines" if settings.DEADLINE_SWEEP_FANOUT else "tc.check_deadlines",
         "schedule": settings.DEADLINE_CHECK_MINUTES * 60,
     },
+    "recompute-health": {
+        "task": "tc.recompute_health",
+        "schedule": settings.HEALTH_RECOMPUTE_MINUTES * 60,
+    },
 }
 celery_app.conf.timezone = "UTC"
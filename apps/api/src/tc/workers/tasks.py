@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+from sqlalchemy.exc import OperationalError
+
 from tc.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -27,7 +29,15 @@ def generate_timeline(transaction_id: str) -> dict:
         db.close()
 
 
-@celery_app.task(name="tc.check_deadlines", acks_late=True)
+# Transient DB failures are retried; the sweep checkpoint makes the retry resume
+# after the last committed batch instead of rescanning every task.
+@celery_app.task(
+    name="tc.check_deadlines",
+    acks_late=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    max_retries=5,
+)
 def check_deadlines_task() -> dict:
     from tc.db.session import SessionLocal
     from tc.services.deadline_service import check_deadlines
@@ -42,3 +52,80 @@ def check_deadlines_task() -> dict:
         raise
     finally:
         db.close()
+
+
+@celery_app.task(
+    name="tc.check_deadlines_for_org",
+    acks_late=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def check_deadlines_for_org(org_id: str) -> dict:
+    from uuid import UUID
+
+    from tc.db.session import SessionLocal
+    from tc.services.deadline_service import check_deadlines
+
+    db = SessionLocal()
+    try:
+        result = check_deadlines(db, org_id=UUID(org_id))
+        logger.info("check_deadlines_for_org %s: %s", org_id, result)
+        return result
+    except Exception:
+        logger.exception("check_deadlines_for_org failed for org_id=%s", org_id)
+        raise
+    finally:
+        db.close()
+
+
+@celery_app.task(name="tc.merge_deadline_results")
+def merge_deadline_results(results: list[dict]) -> dict:
+    from tc.services.deadline_service import merge_sweep_results
+
+    result = merge_sweep_results(results)
+    logger.info("check_deadlines (fan-out): %s", result)
+    return result
+
+
+@celery_app.task(name="tc.fan_out_deadlines", acks_late=True)
+def fan_out_deadlines() -> dict:
+    """Dispatch one deadline sweep per org as a chord; the callback merges the counts."""
+    from celery import chord
+
+    from tc.db.session import SessionLocal
+    from tc.services.deadline_service import list_sweep_org_ids
+
+    db = SessionLocal()
+    try:
+        org_ids = list_sweep_org_ids(db)
+    finally:
+        db.close()
+
+    if org_ids:
+        chord(check_deadlines_for_org.s(str(org_id)) for org_id in org_ids)(
+            merge_deadline_results.s()
+        )
+    logger.info("fan_out_deadlines: dispatched %d org sweeps", len(org_ids))
+    return {"orgs_dispatched": len(org_ids)}
+
+
+@celery_app.task(
+    name="tc.recompute_health",
+    acks_late=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def recompute_health_task() -> dict:
+    from tc.db.session import SessionLocal
+    from tc.services.health_service import recompute_stale_health
+
+    db = SessionLocal()
+    try:
+        return recompute_stale_health(db)
+    except Exception:
+        logger.exception("recompute_health failed")
+        raise
+    finally:
+        db.close()